@@ -11,66 +11,50 @@ from typing import Dict, Optional
 class Config:
     """Loads and validates configuration from environment variables."""
 
-    # Mandatory environment variables
-    MANDATORY_VARS = [
-        "JIRA_BASE_URL",
-        "JIRA_USERNAME",
-        "JIRA_API_TOKEN",
-        "JIRA_PROJECT_KEY",
-    ]
+    # Mandatory environment variables as (env var, attribute name) pairs
+    MANDATORY_VARS = (
+        ("JIRA_BASE_URL", "jira_base_url"),
+        ("JIRA_USERNAME", "jira_username"),
+        ("JIRA_API_TOKEN", "jira_api_token"),
+        ("JIRA_PROJECT_KEY", "jira_project_key"),
+    )
 
     # Optional environment variables with defaults
     DEFAULT_OUTPUT_DIR = "./output"
     DEFAULT_START_DATE_FIELD = None  # e.g., "customfield_10015"
+    DEFAULT_TIMELINE_TITLE = "Jira Milestones Report"
+    DEFAULT_INCREMENTAL_FETCH = "false"
+
+    # (attribute name, environment variable, default value)
+    _SPEC = (
+        ("jira_base_url", "JIRA_BASE_URL", ""),
+        ("jira_username", "JIRA_USERNAME", ""),
+        ("jira_api_token", "JIRA_API_TOKEN", ""),
+        ("jira_project_key", "JIRA_PROJECT_KEY", ""),
+        ("output_dir", "OUTPUT_DIR", DEFAULT_OUTPUT_DIR),
+        ("start_date_field", "START_DATE_FIELD", DEFAULT_START_DATE_FIELD),
+        ("timeline_title", "TIMELINE_TITLE", DEFAULT_TIMELINE_TITLE),
+        ("incremental_fetch", "INCREMENTAL_FETCH", DEFAULT_INCREMENTAL_FETCH),
+    )
+
+    jira_base_url: str
+    jira_username: str
+    jira_api_token: str
+    jira_project_key: str
+    output_dir: str
+    start_date_field: Optional[str]
+    timeline_title: str
+    incremental_fetch: str
 
     def __init__(self):
-        """Initialize configuration by loading environment variables."""
-        self._jira_base_url: str = os.environ.get("JIRA_BASE_URL", "").strip()
-        self._jira_username: str = os.environ.get("JIRA_USERNAME", "").strip()
-        self._jira_api_token: str = os.environ.get("JIRA_API_TOKEN", "").strip()
-        self._jira_project_key: str = os.environ.get("JIRA_PROJECT_KEY", "").strip()
-        self._output_dir: str = os.environ.get(
-            "OUTPUT_DIR", self.DEFAULT_OUTPUT_DIR
-        ).strip()
-        self._start_date_field: Optional[str] = os.environ.get(
-            "START_DATE_FIELD", self.DEFAULT_START_DATE_FIELD
-        )
-        self._timeline_title: str = os.environ.get("TIMELINE_TITLE", "Jira Milestones Report").strip()
-
-    @property
-    def jira_base_url(self) -> str:
-        """Get Jira Base URL."""
-        return self._jira_base_url
-
-    @property
-    def jira_username(self) -> str:
-        """Get Jira username (email)."""
-        return self._jira_username
-
-    @property
-    def jira_api_token(self) -> str:
-        """Get Jira API token."""
-        return self._jira_api_token
-
-    @property
-    def jira_project_key(self) -> str:
-        """Get Jira project key."""
-        return self._jira_project_key
-
-    @property
-    def output_dir(self) -> str:
-        """Get output directory path."""
-        return self._output_dir
-
-    @property
-    def start_date_field(self) -> Optional[str]:
-        """Get optional start date custom field ID."""
-        return self._start_date_field
-
-    @property
-    def timeline_title(self) -> str:
-        """Get timeline title."""
-        return self._timeline_title
+        """Initialize configuration by loading environment variables.
+
+        Values are stored as plain instance attributes so reads are simple
+        attribute lookups.
+        """
+        for attr, env_name, default in self._SPEC:
+            value = os.environ.get(env_name, default)
+            self.__dict__[attr] = value.strip() if value is not None else None
 
     def validate(self) -> None:
         """
@@ -79,12 +63,10 @@ class Config:
         Raises:
             ValueError: If any mandatory variable is missing or empty.
         """
-        missing_vars = []
-
-        for var_name in self.MANDATORY_VARS:
-            value = getattr(self, f"_{var_name.lower()}", "").strip()
-            if not value:
-                missing_vars.append(var_name)
+        # Values were already stripped when loaded
+        missing_vars = [
+            env_name for env_name, attr in self.MANDATORY_VARS if not getattr(self, attr)
+        ]
 
         if missing_vars:
             raise ValueError(
@@ -92,9 +74,9 @@ class Config:
             )
 
         # Validate URL format
-        if not self._jira_base_url.startswith(("http://", "https://")):
+        if not self.jira_base_url.startswith(("http://", "https://")):
             raise ValueError(
-                f"JIRA_BASE_URL must start with http:// or https://, got: {self._jira_base_url}"
+                f"JIRA_BASE_URL must start with http:// or https://, got: {self.jira_base_url}"
             )
 
     def to_dict(self) -> Dict[str, str]:
@@ -107,11 +89,21 @@ class Config:
             Dictionary containing all configuration values.
         """
         return {
-            "jira_base_url": self._jira_base_url,
-            "jira_username": self._jira_username,
-            "jira_api_token": "***" if self._jira_api_token else "",
-            "jira_project_key": self._jira_project_key,
-            "output_dir": self._output_dir,
-            "start_date_field": self._start_date_field or "None",
-            "timeline_title": self._timeline_title,
+            "jira_base_url": self.jira_base_url,
+            "jira_username": self.jira_username,
+            "jira_api_token": "***" if self.jira_api_token else "",
+            "jira_project_key": self.jira_project_key,
+            "output_dir": self.output_dir,
+            "start_date_field": self.start_date_field or "None",
+            "timeline_title": self.timeline_title,
+            "incremental_fetch": self.incremental_fetch,
         }
+
+    def incremental_enabled(self) -> bool:
+        """
+        Check whether incremental fetching with the on-disk issue cache is on.
+
+        Returns:
+            True if INCREMENTAL_FETCH is set to a truthy value.
+        """
+        return self.incremental_fetch.lower() in ("1", "true", "yes", "on")
@@ -5,14 +5,390 @@ Generates self-contained HTML pages:
 - milestone-*.html: Detailed issue table for each milestone
 """
 
+import html
 import logging
+import re
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
+# Characters that html.escape() would rewrite; text without them is emitted as-is
+_HTML_UNSAFE = re.compile(r"[<>&\"']")
+
+# Filename-unsafe characters replaced by _slugify in a single translate pass
+_SLUG_TABLE = str.maketrans({" ": "_", "/": "-"})
+
+# Status category -> badge CSS class (anything else renders gray)
+_STATUS_CLASS = {
+    "Done": "status-green",
+    "In Progress": "status-orange",
+    "To Do": "status-gray",
+}
+
+# Order in which status groups are listed in a milestone report
+_STATUS_GROUP_ORDER = ("status-gray", "status-orange", "status-green")
+
+# Output file buffer: rows are written one by one, so batch them into large
+# chunks before they reach the OS (the io default is only 8 KiB)
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Static page scaffolding, built and UTF-8 encoded once at import time so each
+# render only formats and encodes the small dynamic portions. The *_FMT
+# fragments stay str because they are formatted per page.
+_INDEX_HEAD = (
+    "<!DOCTYPE html>\n"
+    "<html lang=\"en\">\n"
+    "<head>\n"
+    "    <meta charset=\"UTF-8\">\n"
+    "    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">\n"
+    "    <title>"
+).encode("utf-8")
+
+_INDEX_STYLE = (
+    "</title>\n"
+    "    <link rel=\"icon\" href=\"static/favicon.svg\">\n"
+    "    <style>\n"
+    "        * {\n"
+    "            margin: 0;\n"
+    "            padding: 0;\n"
+    "            box-sizing: border-box;\n"
+    "        }\n"
+    "\n"
+    "        body {\n"
+    "            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;\n"
+    "            line-height: 1.6;\n"
+    "            color: #333;\n"
+    "            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\n"
+    "            min-height: 100vh;\n"
+    "            padding: 20px;\n"
+    "        }\n"
+    "\n"
+    "        .container {\n"
+    "            max-width: 1200px;\n"
+    "            margin: 0 auto;\n"
+    "        }\n"
+    "\n"
+    "        header {\n"
+    "            text-align: center;\n"
+    "            color: white;\n"
+    "            margin-bottom: 40px;\n"
+    "            text-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);\n"
+    "        }\n"
+    "\n"
+    "        h1 {\n"
+    "            font-size: 2.5em;\n"
+    "            margin-bottom: 10px;\n"
+    "        }\n"
+    "\n"
+    "        .milestone-card {\n"
+    "            background: white;\n"
+    "            border-radius: 8px;\n"
+    "            padding: 20px;\n"
+    "            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);\n"
+    "            transition: transform 0.2s, box-shadow 0.2s;\n"
+    "            margin: 10px;\n"
+    "        }\n"
+    "\n"
+    "        .epic-link {\n"
+    "            margin-top: 8px;\n"
+    "            font-size: 0.9em;\n"
+    "            color: #555;\n"
+    "        }\n"
+    "\n"
+    "        .epic-link a {\n"
+    "            color: #764ba2;\n"
+    "            text-decoration: none;\n"
+    "            font-weight: 600;\n"
+    "        }\n"
+    "        .milestone-card:hover {\n"
+    "            transform: translateY(-4px);\n"
+    "            box-shadow: 0 8px 12px rgba(0, 0, 0, 0.15);\n"
+    "        }\n"
+    "\n"
+    "        .milestone-card h3 {\n"
+    "            color: #667eea;\n"
+    "            margin-bottom: 10px;\n"
+    "            font-size: 1.3em;\n"
+    "        }\n"
+    "\n"
+    "        .milestone-title-link {\n"
+    "            color: inherit;\n"
+    "            text-decoration: none;\n"
+    "        }\n"
+    "\n"
+    "        .milestone-link {\n"
+    "            display: inline-block;\n"
+    "            padding: 8px 16px;\n"
+    "            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\n"
+    "            color: white;\n"
+    "            text-decoration: none;\n"
+    "            border-radius: 4px;\n"
+    "            transition: opacity 0.2s;\n"
+    "            float: right;\n"
+    "        }\n"
+    "\n"
+    "        .milestone-link:hover {\n"
+    "            opacity: 0.9;\n"
+    "        }\n"
+    "\n"
+    "        footer {\n"
+    "            text-align: center;\n"
+    "            color: rgba(255, 255, 255, 0.8);\n"
+    "            margin-top: 40px;\n"
+    "            font-size: 0.9em;\n"
+    "        }\n"
+    "    </style>\n"
+    "</head>\n"
+    "<body>\n"
+    "    <div class=\"container\">\n"
+    "        <header>\n"
+    "            <h1>"
+).encode("utf-8")
+
+_INDEX_BODY = (
+    "</h1>\n"
+    "            <p class=\"subtitle\">Open Milestones</p>\n"
+    "        </header>\n"
+    "\n"
+    "        <div class=\"milestones-grid\">\n"
+).encode("utf-8")
+
+_INDEX_FOOTER_FMT = (
+    "        </div>\n"
+    "\n"
+    "        <footer>\n"
+    "            <p>Generated by Jira Milestone Reporter on {generated_at}</p>\n"
+    "        </footer>\n"
+    "    </div>\n"
+    "</body>\n"
+    "</html>\n"
+)
+
+_MILESTONE_HEAD = (
+    "<!DOCTYPE html>\n"
+    "<html lang=\"en\">\n"
+    "<head>\n"
+    "    <meta charset=\"UTF-8\">\n"
+    "    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">\n"
+    "    <title>"
+).encode("utf-8")
+
+_MILESTONE_STYLE = (
+    "</title>\n"
+    "    <link rel=\"icon\" href=\"static/favicon.svg\">\n"
+    "    <style>\n"
+    "        * {\n"
+    "            margin: 0;\n"
+    "            padding: 0;\n"
+    "            box-sizing: border-box;\n"
+    "        }\n"
+    "\n"
+    "        body {\n"
+    "            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;\n"
+    "            line-height: 1.6;\n"
+    "            color: #333;\n"
+    "            background: #f5f5f5;\n"
+    "            padding: 20px;\n"
+    "        }\n"
+    "\n"
+    "        .container {\n"
+    "            max-width: 1400px;\n"
+    "            margin: 0 auto;\n"
+    "            background: white;\n"
+    "            border-radius: 8px;\n"
+    "            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);\n"
+    "            padding: 30px;\n"
+    "        }\n"
+    "\n"
+    "        header {\n"
+    "            margin-bottom: 30px;\n"
+    "            border-bottom: 2px solid #667eea;\n"
+    "            padding-bottom: 20px;\n"
+    "        }\n"
+    "\n"
+    "        h1 {\n"
+    "            color: #667eea;\n"
+    "            margin-bottom: 5px;\n"
+    "        }\n"
+    "\n"
+    "        .breadcrumb {\n"
+    "            color: #999;\n"
+    "            font-size: 0.9em;\n"
+    "            margin-top: 10px;\n"
+    "        }\n"
+    "\n"
+    "        .breadcrumb a {\n"
+    "            color: #667eea;\n"
+    "            text-decoration: none;\n"
+    "        }\n"
+    "\n"
+    "        .issues-table {\n"
+    "            width: 100%;\n"
+    "            border-collapse: collapse;\n"
+    "        }\n"
+    "\n"
+    "        .issues-table th {\n"
+    "            text-align: left;\n"
+    "            padding: 12px;\n"
+    "            font-weight: 600;\n"
+    "            color: #667eea;\n"
+    "            font-size: 0.9em;\n"
+    "        }\n"
+    "\n"
+    "        .issues-table td {\n"
+    "            padding: 12px;\n"
+    "            border-bottom: 1px solid #eee;\n"
+    "        }\n"
+    "\n"
+    "        .issues-table a {\n"
+    "            color: #667eea;\n"
+    "            text-decoration: none;\n"
+    "        }\n"
+    "\n"
+    "        .status {\n"
+    "            display: inline-block;\n"
+    "            padding: 4px 8px;\n"
+    "            border-radius: 4px;\n"
+    "            font-size: 0.85em;\n"
+    "            font-weight: 600;\n"
+    "        }\n"
+    "\n"
+    "        .status-green {\n"
+    "            background: #d4edda;\n"
+    "            color: #155724;\n"
+    "        }\n"
+    "\n"
+    "        .status-orange {\n"
+    "            background: #fff3cd;\n"
+    "            color: #856404;\n"
+    "        }\n"
+    "\n"
+    "        .status-gray {\n"
+    "            background: #e9ecef;\n"
+    "            color: #383d41;\n"
+    "        }\n"
+    "\n"
+    "        footer {\n"
+    "            margin-top: 40px;\n"
+    "            padding-top: 20px;\n"
+    "            border-top: 1px solid #eee;\n"
+    "            text-align: center;\n"
+    "            color: #999;\n"
+    "            font-size: 0.9em;\n"
+    "        }\n"
+    "    </style>\n"
+    "</head>\n"
+    "<body>\n"
+    "    <div class=\"container\">\n"
+    "        <header>\n"
+    "            <h1>"
+).encode("utf-8")
+
+_MILESTONE_BODY_FMT = (
+    "</h1>\n"
+    "            <div class=\"breadcrumb\">\n"
+    "                <a href=\"index.html\">Back to Milestones</a>\n"
+    "            </div>\n"
+    "        </header>\n"
+    "\n"
+    "        <h2 style=\"margin-bottom: 20px; color: #333;\">"
+    "Issues ({issue_count})</h2>\n"
+    "\n"
+)
+
+_ISSUES_TABLE_HEAD = (
+    "        <table class=\"issues-table\">\n"
+    "            <thead>\n"
+    "                <tr>\n"
+    "                    <th>Issue Key</th>\n"
+    "                    <th>Summary</th>\n"
+    "                    <th>Status</th>\n"
+    "                    <th>Start Date</th>\n"
+    "                    <th>Due Date</th>\n"
+    "                    <th>Assignee</th>\n"
+    "                </tr>\n"
+    "            </thead>\n"
+    "            <tbody>\n"
+).encode("utf-8")
+
+_ISSUES_TABLE_FOOT = (
+    "            </tbody>\n"
+    "        </table>\n"
+).encode("utf-8")
+
+_NO_ISSUES = (
+    '<div class="no-issues">'
+    "No issues found in this milestone."
+    "</div>\n"
+).encode("utf-8")
+
+_MILESTONE_FOOTER_FMT = (
+    "\n"
+    "        <footer>\n"
+    "            <p>Generated by Jira Milestone Reporter on {generated_at}</p>\n"
+    "        </footer>\n"
+    "    </div>\n"
+    "</body>\n"
+    "</html>\n"
+)
+
+
+def _escape(text: str) -> str:
+    """HTML-escape text, returning it unchanged when it contains nothing unsafe.
+
+    Args:
+        text: Untrusted text (e.g., Jira summary or assignee name)
+
+    Returns:
+        Text safe to embed in HTML content and quoted attributes
+    """
+    if _HTML_UNSAFE.search(text):
+        return html.escape(text, quote=True)
+    return text
+
+
+def _index_card_html(milestone: Dict, browse_url: str) -> str:
+    """Render one milestone card of the index page.
+
+    Args:
+        milestone: Milestone dictionary with id, name, description, key and
+            issue_count
+        browse_url: Jira browse URL prefix that issue keys are appended to
+
+    Returns:
+        HTML for the card
+    """
+    milestone_id = milestone.get("id", "unknown")
+    milestone_file = _escape(f"milestone-{milestone_id}.html")
+    issue_count = milestone.get("issue_count", 0)
+    epic_key = _escape(milestone.get("key") or "")
+    epic_link_html = (
+        f'            <p class="epic-link">\n'
+        f'                <a href="{browse_url}{epic_key}" target="_blank">Epic {epic_key}</a>\n'
+        f'            </p>\n'
+        if epic_key
+        else ""
+    )
+
+    return (
+        f'        <div class="milestone-card">\n'
+        f'            <h3><a class="milestone-title-link" href="{milestone_file}">{_escape(milestone.get("name") or "Unknown")}</a></h3>\n'
+        f'            <p class="milestone-description">\n'
+        f'{_escape(milestone.get("description") or "")}\n'
+        f'            </p>\n'
+        f'            <div class="milestone-meta">\n'
+        f'                <span class="issue-count">Issues: {issue_count}</span>\n'
+        f'            </div>\n'
+        f'{epic_link_html}'
+        f'            <a href="{milestone_file}" class="milestone-link">\n'
+        f'                View Details\n'
+        f'            </a>\n'
+        f'        </div>\n'
+    )
+
 
 class HTMLRenderer:
     """Generates static HTML for milestone reports."""
@@ -26,6 +402,28 @@ class HTMLRenderer:
         """
         self.base_url = base_url.rstrip("/")
         self.title = title
+        self._ensured_dirs: Set[Path] = set()
+        # Issue links only differ by key; rows append it to this prefix
+        self._browse_url = f"{self.base_url}/browse/"
+
+        # The title appears on every page, so escape and encode it only once
+        self._title_html = _escape(title).encode("utf-8")
+
+        # The index page up to the first milestone card only depends on the
+        # title, so assemble it once per renderer instead of on every render
+        self._index_header = b"".join(
+            (_INDEX_HEAD, self._title_html, _INDEX_STYLE, self._title_html, _INDEX_BODY)
+        )
+
+    def _ensure_dir(self, output_dir: Path) -> None:
+        """Create output directory once per renderer.
+
+        Args:
+            output_dir: Output directory path
+        """
+        if output_dir not in self._ensured_dirs:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(output_dir)
 
     def _slugify(self, text: str) -> str:
         """Convert text to filesystem-safe slug.
@@ -36,7 +434,7 @@ class HTMLRenderer:
         Returns:
             Slugified string safe for use in filenames
         """
-        return text.lower().replace(" ", "_").replace("/", "-")
+        return text.lower().translate(_SLUG_TABLE)
 
     def _get_issue_url(self, issue_key: str) -> str:
         """Get full Jira URL for an issue.
@@ -47,14 +445,21 @@ class HTMLRenderer:
         Returns:
             Full URL to the issue in Jira
         """
-        return f"{self.base_url}/browse/{issue_key}"
+        return f"{self._browse_url}{issue_key}"
 
-    def render_index(self, milestones: List[Dict], output_dir: Path) -> Path:
+    def render_index(
+        self,
+        milestones: List[Dict],
+        output_dir: Path,
+        generated_at: Optional[str] = None,
+    ) -> Path:
         """Generate index.html with all open milestones.
 
         Args:
             milestones: List of milestone dictionaries
             output_dir: Output directory path
+            generated_at: Generation timestamp shown in the footer
+                (default: current time)
 
         Returns:
             Path to generated index.html
@@ -62,10 +467,11 @@ class HTMLRenderer:
         logger.info("Rendering index.html")
 
         # Create output dir if needed
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Get current timestamp
-        generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._ensure_dir(output_dir)
+
+        # Get current timestamp unless the caller shares one across the batch
+        if generated_at is None:
+            generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         # Copy the repository `static/` directory into the output directory so
         # generated pages can reference assets (favicon, css, images, etc.).
@@ -91,170 +497,27 @@ class HTMLRenderer:
         except Exception as e:
             logger.warning(f"Failed to copy static folder to output: {e}")
 
-        # Build milestone cards HTML
-        milestone_cards = []
-        for milestone in milestones:
-            milestone_id = milestone.get("id", "unknown")
-            milestone_file = f"milestone-{milestone_id}.html"
-            issue_count = milestone.get("issue_count", 0)
-            epic_key = milestone.get("key")
-            epic_link_html = (
-                f'            <p class="epic-link">\n'
-                f'                <a href="{self.base_url}/browse/{epic_key}" target="_blank">Epic {epic_key}</a>\n'
-                f'            </p>\n'
-                if epic_key
-                else ""
-            )
+        output_file = output_dir / "index.html"
 
-            card_html = (
-                f'        <div class="milestone-card">\n'
-                f'            <h3><a class="milestone-title-link" href="{milestone_file}">{milestone.get("name", "Unknown")}</a></h3>\n'
-                f'            <p class="milestone-description">\n'
-                f'{milestone.get("description", "")}\n'
-                f'            </p>\n'
-                f'            <div class="milestone-meta">\n'
-                f'                <span class="issue-count">Issues: {issue_count}</span>\n'
-                f'            </div>\n'
-                f'{epic_link_html}'
-                f'            <a href="{milestone_file}" class="milestone-link">\n'
-                f'                View Details\n'
-                f'            </a>\n'
-                f'        </div>'
-            )
-            milestone_cards.append(card_html)
-
-        milestone_html = "\n".join(milestone_cards)
-
-        # Generate HTML
-        html_content = (
-            f"<!DOCTYPE html>\n"
-            f"<html lang=\"en\">\n"
-            f"<head>\n"
-            f"    <meta charset=\"UTF-8\">\n"
-            f"    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">\n"
-            f"    <title>{self.title}</title>\n"
-            f"    <link rel=\"icon\" href=\"static/favicon.svg\">\n"
-            f"    <style>\n"
-            f"        * {{\n"
-            f"            margin: 0;\n"
-            f"            padding: 0;\n"
-            f"            box-sizing: border-box;\n"
-            f"        }}\n"
-            f"\n"
-            f"        body {{\n"
-            f"            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;\n"
-            f"            line-height: 1.6;\n"
-            f"            color: #333;\n"
-            f"            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\n"
-            f"            min-height: 100vh;\n"
-            f"            padding: 20px;\n"
-            f"        }}\n"
-            f"\n"
-            f"        .container {{\n"
-            f"            max-width: 1200px;\n"
-            f"            margin: 0 auto;\n"
-            f"        }}\n"
-            f"\n"
-            f"        header {{\n"
-            f"            text-align: center;\n"
-            f"            color: white;\n"
-            f"            margin-bottom: 40px;\n"
-            f"            text-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);\n"
-            f"        }}\n"
-            f"\n"
-            f"        h1 {{\n"
-            f"            font-size: 2.5em;\n"
-            f"            margin-bottom: 10px;\n"
-            f"        }}\n"
-            f"\n"
-            f"        .milestone-card {{\n"
-            f"            background: white;\n"
-            f"            border-radius: 8px;\n"
-            f"            padding: 20px;\n"
-            f"            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);\n"
-            f"            transition: transform 0.2s, box-shadow 0.2s;\n"
-            f"            margin: 10px;\n"
-            f"        }}\n"
-            f"\n"
-            f"        .epic-link {{\n"
-            f"            margin-top: 8px;\n"
-            f"            font-size: 0.9em;\n"
-            f"            color: #555;\n"
-            f"        }}\n"
-            f"\n"
-            f"        .epic-link a {{\n"
-            f"            color: #764ba2;\n"
-            f"            text-decoration: none;\n"
-            f"            font-weight: 600;\n"
-            f"        }}\n"
-
-            f"        .milestone-card:hover {{\n"
-            f"            transform: translateY(-4px);\n"
-            f"            box-shadow: 0 8px 12px rgba(0, 0, 0, 0.15);\n"
-            f"        }}\n"
-            f"\n"
-            f"        .milestone-card h3 {{\n"
-            f"            color: #667eea;\n"
-            f"            margin-bottom: 10px;\n"
-            f"            font-size: 1.3em;\n"
-            f"        }}\n"
-            f"\n"
-            f"        .milestone-title-link {{\n"
-            f"            color: inherit;\n"
-            f"            text-decoration: none;\n"
-            f"        }}\n"
-            f"\n"
-            f"        .milestone-link {{\n"
-            f"            display: inline-block;\n"
-            f"            padding: 8px 16px;\n"
-            f"            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\n"
-            f"            color: white;\n"
-            f"            text-decoration: none;\n"
-            f"            border-radius: 4px;\n"
-            f"            transition: opacity 0.2s;\n"
-            f"            float: right;\n"
-            f"        }}\n"
-            f"\n"
-            f"        .milestone-link:hover {{\n"
-            f"            opacity: 0.9;\n"
-            f"        }}\n"
-            f"\n"
-            f"        footer {{\n"
-            f"            text-align: center;\n"
-            f"            color: rgba(255, 255, 255, 0.8);\n"
-            f"            margin-top: 40px;\n"
-            f"            font-size: 0.9em;\n"
-            f"        }}\n"
-            f"    </style>\n"
-            f"</head>\n"
-            f"<body>\n"
-            f"    <div class=\"container\">\n"
-            f"        <header>\n"
-            f"            <h1>{self.title}</h1>\n"
-            f"            <p class=\"subtitle\">Open Milestones</p>\n"
-            f"        </header>\n"
-            f"\n"
-            f"        <div class=\"milestones-grid\">\n"
-            f"{milestone_html}\n"
-            f"        </div>\n"
-            f"\n"
-            f"        <footer>\n"
-            f"            <p>Generated by Jira Milestone Reporter on {generated_at}</p>\n"
-            f"        </footer>\n"
-            f"    </div>\n"
-            f"</body>\n"
-            f"</html>\n"
-        )
+        # The index holds one short card per milestone, so collect the cards
+        # and encode them in a single pass rather than streaming row by row
+        browse_url = self._browse_url
+        parts = [_index_card_html(milestone, browse_url) for milestone in milestones]
+        parts.append(_INDEX_FOOTER_FMT.format(generated_at=generated_at))
+
+        # The page is already complete in memory: write it as one bytes object
+        output_file.write_bytes(self._index_header + "".join(parts).encode("utf-8"))
 
-        # Write file
-        output_file = output_dir / "index.html"
-        output_file.write_text(html_content, encoding="utf-8")
         logger.info(f"Index saved to: {output_file}")
 
         return output_file
 
     def render_milestone_report(
-        self, milestone: Dict, issues: List[Dict], output_dir: Path
+        self,
+        milestone: Dict,
+        issues: List[Dict],
+        output_dir: Path,
+        generated_at: Optional[str] = None,
     ) -> Path:
         """Generate detailed milestone report with issue table.
 
@@ -262,6 +525,8 @@ class HTMLRenderer:
             milestone: Milestone dictionary with id, name, description
             issues: List of issue dictionaries for this milestone
             output_dir: Output directory path
+            generated_at: Generation timestamp shown in the footer
+                (default: current time)
 
         Returns:
             Path to generated milestone HTML file
@@ -269,214 +534,66 @@ class HTMLRenderer:
         logger.info(f"Rendering milestone report: {milestone.get('name')}")
 
         # Create output dir if needed
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Get current timestamp
-        generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        # Build issue table rows
-        issue_rows = []
-        for issue in issues:
-            key = issue.get("key", "")
-            summary = issue.get("summary", "")
-            status = issue.get("status", "To Do")
-            due_date = issue.get("due_date", "")
-            start_date = issue.get("start_date", "")
-            assignee = issue.get("assignee", "Unassigned")
-
-            # Format dates
-            due_date_str = due_date if due_date else "-"
-            start_date_str = start_date if start_date else "-"
-
-            # Status badge color
-            if status == "Done":
-                status_color = "green"
-            elif status == "In Progress":
-                status_color = "orange"
-            else:
-                status_color = "gray"
-
-            issue_url = self._get_issue_url(key)
-
-            row_html = (
-                f"        <tr>\n"
-                f'            <td><a href="{issue_url}" target="_blank">{key}</a></td>\n'
-                f"            <td>{summary}</td>\n"
-                f'            <td><span class="status status-{status_color}">'
-                f"{status}</span></td>\n"
-                f"            <td>{start_date_str}</td>\n"
-                f"            <td>{due_date_str}</td>\n"
-                f"            <td>{assignee}</td>\n"
-                f"        </tr>"
-            )
-            issue_rows.append(row_html)
-
-        issue_table = "\n".join(issue_rows)
-        milestone_name = milestone.get("name", "Unknown")
-
-        # Generate table or no-issues message
-        if issues:
-            table_html = (
-                "        <table class=\"issues-table\">\n"
-                "            <thead>\n"
-                "                <tr>\n"
-                "                    <th>Issue Key</th>\n"
-                "                    <th>Summary</th>\n"
-                "                    <th>Status</th>\n"
-                "                    <th>Start Date</th>\n"
-                "                    <th>Due Date</th>\n"
-                "                    <th>Assignee</th>\n"
-                "                </tr>\n"
-                "            </thead>\n"
-                "            <tbody>\n"
-                f"{issue_table}\n"
-                "            </tbody>\n"
-                "        </table>"
-            )
-        else:
-            table_html = (
-                '<div class="no-issues">'
-                "No issues found in this milestone."
-                "</div>"
-            )
+        self._ensure_dir(output_dir)
 
-        # Generate HTML
-        html_content = (
-            f"<!DOCTYPE html>\n"
-            f"<html lang=\"en\">\n"
-            f"<head>\n"
-            f"    <meta charset=\"UTF-8\">\n"
-            f"    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">\n"
-            f"    <title>{milestone_name} - {self.title}</title>\n"
-            f"    <link rel=\"icon\" href=\"static/favicon.svg\">\n"
-            f"    <style>\n"
-            f"        * {{\n"
-            f"            margin: 0;\n"
-            f"            padding: 0;\n"
-            f"            box-sizing: border-box;\n"
-            f"        }}\n"
-            f"\n"
-            f"        body {{\n"
-            f"            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;\n"
-            f"            line-height: 1.6;\n"
-            f"            color: #333;\n"
-            f"            background: #f5f5f5;\n"
-            f"            padding: 20px;\n"
-            f"        }}\n"
-            f"\n"
-            f"        .container {{\n"
-            f"            max-width: 1400px;\n"
-            f"            margin: 0 auto;\n"
-            f"            background: white;\n"
-            f"            border-radius: 8px;\n"
-            f"            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);\n"
-            f"            padding: 30px;\n"
-            f"        }}\n"
-            f"\n"
-            f"        header {{\n"
-            f"            margin-bottom: 30px;\n"
-            f"            border-bottom: 2px solid #667eea;\n"
-            f"            padding-bottom: 20px;\n"
-            f"        }}\n"
-            f"\n"
-            f"        h1 {{\n"
-            f"            color: #667eea;\n"
-            f"            margin-bottom: 5px;\n"
-            f"        }}\n"
-            f"\n"
-            f"        .breadcrumb {{\n"
-            f"            color: #999;\n"
-            f"            font-size: 0.9em;\n"
-            f"            margin-top: 10px;\n"
-            f"        }}\n"
-            f"\n"
-            f"        .breadcrumb a {{\n"
-            f"            color: #667eea;\n"
-            f"            text-decoration: none;\n"
-            f"        }}\n"
-            f"\n"
-            f"        .issues-table {{\n"
-            f"            width: 100%;\n"
-            f"            border-collapse: collapse;\n"
-            f"        }}\n"
-            f"\n"
-            f"        .issues-table th {{\n"
-            f"            text-align: left;\n"
-            f"            padding: 12px;\n"
-            f"            font-weight: 600;\n"
-            f"            color: #667eea;\n"
-            f"            font-size: 0.9em;\n"
-            f"        }}\n"
-            f"\n"
-            f"        .issues-table td {{\n"
-            f"            padding: 12px;\n"
-            f"            border-bottom: 1px solid #eee;\n"
-            f"        }}\n"
-            f"\n"
-            f"        .issues-table a {{\n"
-            f"            color: #667eea;\n"
-            f"            text-decoration: none;\n"
-            f"        }}\n"
-            f"\n"
-            f"        .status {{\n"
-            f"            display: inline-block;\n"
-            f"            padding: 4px 8px;\n"
-            f"            border-radius: 4px;\n"
-            f"            font-size: 0.85em;\n"
-            f"            font-weight: 600;\n"
-            f"        }}\n"
-            f"\n"
-            f"        .status-green {{\n"
-            f"            background: #d4edda;\n"
-            f"            color: #155724;\n"
-            f"        }}\n"
-            f"\n"
-            f"        .status-orange {{\n"
-            f"            background: #fff3cd;\n"
-            f"            color: #856404;\n"
-            f"        }}\n"
-            f"\n"
-            f"        .status-gray {{\n"
-            f"            background: #e9ecef;\n"
-            f"            color: #383d41;\n"
-            f"        }}\n"
-            f"\n"
-            f"        footer {{\n"
-            f"            margin-top: 40px;\n"
-            f"            padding-top: 20px;\n"
-            f"            border-top: 1px solid #eee;\n"
-            f"            text-align: center;\n"
-            f"            color: #999;\n"
-            f"            font-size: 0.9em;\n"
-            f"        }}\n"
-            f"    </style>\n"
-            f"</head>\n"
-            f"<body>\n"
-            f"    <div class=\"container\">\n"
-            f"        <header>\n"
-            f"            <h1>{milestone_name}</h1>\n"
-            f"            <div class=\"breadcrumb\">\n"
-            f"                <a href=\"index.html\">Back to Milestones</a>\n"
-            f"            </div>\n"
-            f"        </header>\n"
-            f"\n"
-            f"        <h2 style=\"margin-bottom: 20px; color: #333;\">"
-            f"Issues ({len(issues)})</h2>\n"
-            f"\n"
-            f"{table_html}\n"
-            f"\n"
-            f"        <footer>\n"
-            f"            <p>Generated by Jira Milestone Reporter on {generated_at}</p>\n"
-            f"        </footer>\n"
-            f"    </div>\n"
-            f"</body>\n"
-            f"</html>\n"
-        )
+        # Get current timestamp unless the caller shares one across the batch
+        if generated_at is None:
+            generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        # Write file
         milestone_id = milestone.get("id", "unknown")
         output_file = output_dir / f"milestone-{milestone_id}.html"
-        output_file.write_text(html_content, encoding="utf-8")
+        milestone_name = _escape(milestone.get("name") or "Unknown").encode("utf-8")
+
+        # Stream the page to disk, one issue row at a time
+        with output_file.open("wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            write = f.write
+            write(_MILESTONE_HEAD)
+            write(milestone_name)
+            write(b" - ")
+            write(self._title_html)
+            write(_MILESTONE_STYLE)
+            write(milestone_name)
+            write(_MILESTONE_BODY_FMT.format(issue_count=len(issues)).encode("utf-8"))
+
+            # Issue table or no-issues message
+            if issues:
+                browse_url = self._browse_url
+                write(_ISSUES_TABLE_HEAD)
+
+                # Group rows by badge class (To Do, In Progress, Done), keeping
+                # the search order within each group, so the badge markup is
+                # built once per group instead of once per row
+                groups: Dict[str, List[Dict]] = {
+                    css: [] for css in _STATUS_GROUP_ORDER
+                }
+                for issue in issues:
+                    status = issue.get("status") or "To Do"
+                    groups[_STATUS_CLASS.get(status, "status-gray")].append(issue)
+
+                for status_class, rows in groups.items():
+                    badge_open = f'            <td><span class="status {status_class}">'
+                    for issue in rows:
+                        key = _escape(issue.get("key") or "")
+                        row_html = (
+                            f"        <tr>\n"
+                            f'            <td><a href="{browse_url}{key}" target="_blank">{key}</a></td>\n'
+                            f"            <td>{_escape(issue.get('summary') or '')}</td>\n"
+                            f"{badge_open}"
+                            f"{_escape(issue.get('status') or 'To Do')}</span></td>\n"
+                            f"            <td>{_escape(issue.get('start_date') or '-')}</td>\n"
+                            f"            <td>{_escape(issue.get('due_date') or '-')}</td>\n"
+                            f"            <td>{_escape(issue.get('assignee') or 'Unassigned')}</td>\n"
+                            f"        </tr>\n"
+                        )
+                        write(row_html.encode("utf-8"))
+                write(_ISSUES_TABLE_FOOT)
+            else:
+                write(_NO_ISSUES)
+
+            write(
+                _MILESTONE_FOOTER_FMT.format(generated_at=generated_at).encode("utf-8")
+            )
+
         logger.info(f"Milestone report saved to: {output_file}")
 
         return output_file
@@ -0,0 +1,143 @@
+"""
+On-disk cache of normalized issues for incremental report builds.
+
+Stores the issues of each milestone between runs so that a warm run only
+needs to fetch the issues updated since the previous run.
+"""
+
+import logging
+import math
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:  # pragma: no cover - exercised only without orjson
+    import json
+
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+logger = logging.getLogger(__name__)
+
+
+class IssueCache:
+    """Per-milestone cache of normalized issues, keyed by issue key.
+
+    Incremental searches cannot see issues that were deleted or moved to
+    another milestone, so the cache is discarded and everything is fetched
+    again once the last full fetch is older than FULL_REFRESH_SECONDS.
+    """
+
+    FILENAME = "issues.json"
+    FORMAT_VERSION = 1
+    # Force a full refetch at least once a week
+    FULL_REFRESH_SECONDS = 7 * 24 * 3600
+    # Overlap between runs to absorb clock skew and slow searches
+    SAFETY_MARGIN_MINUTES = 5
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize an empty cache stored under cache_dir.
+
+        Args:
+            cache_dir: Directory holding the cache file
+        """
+        self.path = Path(cache_dir) / self.FILENAME
+        self.last_run: Optional[float] = None
+        self.full_run: Optional[float] = None
+        self._milestones: Dict[str, Dict[str, Dict]] = {}
+
+    def load(self, now: Optional[float] = None) -> None:
+        """
+        Load the cache file, ignoring missing, unreadable or expired caches.
+
+        Args:
+            now: Current time in epoch seconds (default: time.time())
+        """
+        now = time.time() if now is None else now
+        try:
+            data = _json_loads(self.path.read_bytes())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable issue cache %s: %s", self.path, e)
+            return
+
+        if not isinstance(data, dict) or data.get("version") != self.FORMAT_VERSION:
+            logger.info("Ignoring issue cache with unknown format")
+            return
+        full_run = data.get("full_run")
+        if not full_run or now - full_run > self.FULL_REFRESH_SECONDS:
+            logger.info("Issue cache expired, fetching all issues")
+            return
+
+        self.last_run = data.get("last_run")
+        self.full_run = full_run
+        self._milestones = data.get("milestones") or {}
+
+    def updated_within_minutes(
+        self, milestone_key: str, now: Optional[float] = None
+    ) -> Optional[int]:
+        """
+        Get the search window needed to refresh a cached milestone.
+
+        Args:
+            milestone_key: Epic key of the milestone
+            now: Current time in epoch seconds (default: time.time())
+
+        Returns:
+            Minutes to pass to an `updated >= -Nm` JQL clause, or None when
+            the milestone is not cached and must be fetched in full
+        """
+        if self.last_run is None or milestone_key not in self._milestones:
+            return None
+        now = time.time() if now is None else now
+        elapsed = max(now - self.last_run, 0) / 60
+        return math.ceil(elapsed) + self.SAFETY_MARGIN_MINUTES
+
+    def merge(self, milestone_key: str, issues: List[Dict], full: bool) -> List[Dict]:
+        """
+        Merge fetched issues into the cached issues of a milestone.
+
+        Args:
+            milestone_key: Epic key of the milestone
+            issues: Normalized issues returned by the search
+            full: Whether issues is the complete result (replaces the cache)
+
+        Returns:
+            All issues of the milestone, in cache order
+        """
+        cached = {} if full else self._milestones.get(milestone_key, {})
+        cached.update({issue["key"]: issue for issue in issues})
+        self._milestones[milestone_key] = cached
+        return list(cached.values())
+
+    def save(self, run_started: float, milestone_keys: List[str]) -> None:
+        """
+        Write the cache, keeping only the given milestones.
+
+        Args:
+            run_started: Epoch seconds at which this run started fetching
+            milestone_keys: Milestones refreshed successfully during this run
+        """
+        data = {
+            "version": self.FORMAT_VERSION,
+            "last_run": run_started,
+            "full_run": self.full_run if self.full_run is not None else run_started,
+            "milestones": {
+                key: self._milestones[key]
+                for key in milestone_keys
+                if key in self._milestones
+            },
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so an interrupted run never leaves
+        # a truncated cache behind
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_bytes(_json_dumps(data))
+        tmp_path.replace(self.path)
@@ -6,13 +6,24 @@ Handles authentication, API calls, pagination, and error handling.
 
 import base64
 import logging
+import math
+import random
 import time
-from typing import Dict, List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple, TypedDict
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    # orjson decodes large search pages several times faster than json
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - exercised only without orjson
+    from json import loads as _json_loads
+
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +46,39 @@ class JiraAPIError(JiraClientError):
     pass
 
 
+class NormalizedIssue(TypedDict):
+    """Issue fields used by the reporter, as returned by JiraClient searches."""
+
+    key: str
+    summary: str
+    status: str
+    due_date: Optional[str]
+    start_date: Optional[str]
+    milestone: str
+    assignee: str
+
+
+def _version_name(value) -> str:
+    """
+    Extract a version name from a Fix/Affects Version field value.
+
+    Args:
+        value: Field value (list of versions, single version dict, or scalar)
+
+    Returns:
+        Name of the first version, or empty string if unset
+    """
+    if not value:
+        return ""
+    if isinstance(value, list):
+        value = value[0]
+        if not value:
+            return ""
+    if isinstance(value, dict):
+        return value.get("name", "")
+    return str(value)
+
+
 class JiraClient:
     """Client for interacting with Jira Cloud REST API."""
 
@@ -42,9 +86,9 @@ class JiraClient:
     API_VERSION = "3"
     SEARCH_ENDPOINT = "/rest/api/{version}/search/jql"
 
-        # Fields to retrieve from Jira
+    # Fields to retrieve from Jira; the issue key is always returned at the
+    # top level of each issue, so it is not requested as a field
     FIELDS = [
-        "key",
         "summary",
         "status",
         "duedate",
@@ -54,10 +98,28 @@ class JiraClient:
         "customfield_10041",  # Affects Version (milestone)
     ]
 
+    # Fields needed to describe an Epic milestone
+    MILESTONE_FIELDS = ["summary", "description"]
+
+    # Issues requested per search page (maximum accepted by /search/jql)
+    PAGE_SIZE = 100
+
+    # Concurrent page requests once the first page reveals the total
+    PAGE_WORKERS = 4
+
+    # Keep-alive connections kept per host: enough for the reporter's 5
+    # concurrent milestone fetches x PAGE_WORKERS page requests each
+    POOL_MAXSIZE = 20
+
     # Retry configuration
     MAX_RETRIES = 3
     RETRY_BACKOFF_FACTOR = 0.5
     TIMEOUT_SECONDS = 30
+    # Longest Retry-After we are willing to sleep for; longer waits fail fast
+    MAX_RETRY_AFTER_SECONDS = 60
+
+    # Seconds a project's milestone list is reused before it is fetched again
+    VERSIONS_CACHE_TTL = 300
 
     def __init__(self, base_url: str, username: str, api_token: str):
         """
@@ -71,13 +133,29 @@ class JiraClient:
         Raises:
             JiraAuthError: If credentials are invalid or missing
         """
-        if not all([base_url, username, api_token]):
+        # Credentials are only validated here, never again on the request path
+        if not (base_url and username and api_token):
             raise JiraAuthError("Base URL, username, and API token are required")
 
         self.base_url = base_url.rstrip("/")
         self.username = username
         self.api_token = api_token
 
+        # Basic auth credentials never change, so build the complete header
+        # value once; base64 output is ASCII, so it decodes straight to str
+        credentials = f"{username}:{api_token}".encode("utf-8")
+        auth_value = (b"Basic " + base64.b64encode(credentials)).decode("ascii")
+        self._auth_header = {"Authorization": auth_value}
+
+        # Search path and field list are constant for the client's lifetime
+        self._search_path = self.SEARCH_ENDPOINT.format(version=self.API_VERSION)
+        self._fields_csv = ",".join(self.FIELDS)
+        self._milestone_fields_csv = ",".join(self.MILESTONE_FIELDS)
+
+        # Milestones already fetched by this client, keyed by project key, with
+        # the time.monotonic() at which they were fetched
+        self._versions_cache: Dict[str, Tuple[float, List[Dict]]] = {}
+
         # Setup session with retry strategy
         self.session = self._setup_session()
 
@@ -89,31 +167,96 @@ class JiraClient:
             Configured requests session
         """
         session = requests.Session()
+        # Default headers live on the session, so requests do not pass and
+        # merge them on every call
+        session.headers.update(self._build_auth_header())
+        session.headers["Accept"] = "application/json"
 
         # Configure retry strategy
         retry_strategy = Retry(
             total=self.MAX_RETRIES,
             backoff_factor=self.RETRY_BACKOFF_FACTOR,
-            status_forcelist=[429, 500, 502, 503, 504],
+            # 429 is retried by _make_request, which honors Retry-After with
+            # jitter; keep urllib3 from also acting on that header
+            status_forcelist=[500, 502, 503, 504],
             allowed_methods=["GET", "HEAD"],
+            respect_retry_after_header=False,
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy, pool_maxsize=self.POOL_MAXSIZE
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
         return session
 
+    def invalidate_versions(self, project_key: Optional[str] = None) -> None:
+        """
+        Drop cached milestones so the next get_project_versions() refetches.
+
+        Args:
+            project_key: Project to invalidate (default: all projects)
+        """
+        if project_key is None:
+            self._versions_cache.clear()
+        else:
+            self._versions_cache.pop(project_key, None)
+
+    def close(self) -> None:
+        """Close the session and release its pooled keep-alive connections."""
+        self.session.close()
+
+    def __enter__(self) -> "JiraClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def _build_auth_header(self) -> Dict[str, str]:
         """
-        Build Basic Auth header for Jira API.
+        Get the Basic Auth header for Jira API.
+
+        The header is encoded once in __init__ and shared by every request.
 
         Returns:
             Dictionary with Authorization header
         """
-        credentials = f"{self.username}:{self.api_token}"
-        encoded = base64.b64encode(credentials.encode()).decode()
-        return {"Authorization": f"Basic {encoded}"}
+        return self._auth_header
+
+    def _rate_limit_delay(self, response: requests.Response, attempt: int) -> float:
+        """
+        Compute how long to wait before retrying a rate-limited request.
+
+        Uses the server's Retry-After header when present, never less than the
+        exponential backoff for this attempt, plus random jitter so concurrent
+        workers do not retry in lockstep.
+
+        Args:
+            response: The 429 response
+            attempt: Zero-based retry attempt number
+
+        Returns:
+            Delay in seconds
+
+        Raises:
+            JiraAPIError: If Retry-After exceeds MAX_RETRY_AFTER_SECONDS
+        """
+        backoff = self.RETRY_BACKOFF_FACTOR * (2 ** attempt)
+        try:
+            retry_after = float(response.headers.get("Retry-After", 0))
+        except ValueError:
+            # HTTP-date form is not worth parsing here; fall back to backoff
+            retry_after = 0.0
+        if not math.isfinite(retry_after):
+            # inf/nan cannot be slept on; treat them like a malformed header
+            retry_after = 0.0
+        if retry_after > self.MAX_RETRY_AFTER_SECONDS:
+            raise JiraAPIError(
+                f"Rate limited by Jira (429): Retry-After of {retry_after:.0f}s "
+                f"exceeds the {self.MAX_RETRY_AFTER_SECONDS}s limit"
+            )
+        return max(retry_after, backoff) + random.uniform(0, backoff)
 
     def _make_request(
         self, method: str, endpoint: str, params: Optional[Dict] = None
@@ -133,23 +276,30 @@ class JiraClient:
             JiraAPIError: If request fails
         """
         url = f"{self.base_url}{endpoint}"
-        headers = self._build_auth_header()
-        headers["Accept"] = "application/json"
 
         try:
-            response = self.session.request(
-                method,
-                url,
-                headers=headers,
-                params=params,
-                timeout=self.TIMEOUT_SECONDS,
-            )
+            for attempt in range(self.MAX_RETRIES + 1):
+                response = self.session.request(
+                    method,
+                    url,
+                    params=params,
+                    timeout=self.TIMEOUT_SECONDS,
+                )
+                if response.status_code != 429 or attempt == self.MAX_RETRIES:
+                    break
+
+                delay = self._rate_limit_delay(response, attempt)
+                logger.warning(
+                    f"Rate limited by Jira (429), retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 1}/{self.MAX_RETRIES})"
+                )
+                time.sleep(delay)
 
             # Check for HTTP errors
             if response.status_code >= 400:
                 error_body = response.text
                 try:
-                    error_json = response.json()
+                    error_json = _json_loads(response.content)
                     error_msg = error_json.get("errorMessages", [error_body])
                     if isinstance(error_msg, list):
                         error_msg = "; ".join(error_msg)
@@ -160,14 +310,15 @@ class JiraClient:
                     f"Jira API error ({response.status_code}): {error_msg}"
                 )
 
-            return response.json()
+            # Parse the raw bytes directly; skips requests' text decoding step
+            return _json_loads(response.content)
 
         except requests.RequestException as e:
             raise JiraAPIError(f"Request failed: {str(e)}")
         except ValueError as e:
             raise JiraAPIError(f"Invalid JSON response: {str(e)}")
 
-    def _normalize_issue(self, issue: Dict) -> Dict:
+    def _normalize_issue(self, issue: Dict) -> NormalizedIssue:
         """
         Normalize Jira issue to standard format.
 
@@ -177,118 +328,201 @@ class JiraClient:
         Returns:
             Normalized issue dictionary
         """
-        fields = issue.get("fields", {})
-
-        # Extract status category
-        status_obj = fields.get("status", {})
+        # Flat .get() chains with `or {}` so null fields need no branching
+        fields = issue.get("fields") or {}
         status_category = (
-            status_obj.get("statusCategory", {}).get("name", "To Do")
-            if status_obj
-            else "To Do"
+            ((fields.get("status") or {}).get("statusCategory") or {}).get("name")
+            or "To Do"
         )
 
-        # Normalize status category name
-        status_map = {
-            "Done": "Done",
-            "In Progress": "In Progress",
-            "To Do": "To Do",
-        }
-        normalized_status = status_map.get(status_category, status_category)
-        
-        # Extract milestone from customfield_10037 or customfield_10041
-        milestone = ""
+        # Extract milestone from customfield_10037, falling back to customfield_10041.
+        # Most issues have neither set, so skip the extraction calls entirely.
         fix_version = fields.get("customfield_10037")
-        if fix_version:
-            if isinstance(fix_version, list) and fix_version:
-                milestone = fix_version[0].get("name", "") if isinstance(fix_version[0], dict) else str(fix_version[0])
-            elif isinstance(fix_version, dict):
-                milestone = fix_version.get("name", "")
-            else:
-                milestone = str(fix_version)
-        
-        # Fallback to affects version if fix version not set
-        if not milestone:
-            affects_version = fields.get("customfield_10041")
-            if affects_version:
-                if isinstance(affects_version, list) and affects_version:
-                    milestone = affects_version[0].get("name", "") if isinstance(affects_version[0], dict) else str(affects_version[0])
-                elif isinstance(affects_version, dict):
-                    milestone = affects_version.get("name", "")
-                else:
-                    milestone = str(affects_version)
-
-        # Extract assignee
-        assignee_obj = fields.get("assignee")
-        assignee = assignee_obj.get("displayName") if assignee_obj else "Unassigned"
+        affects_version = fields.get("customfield_10041")
+        if fix_version or affects_version:
+            milestone = _version_name(fix_version) or _version_name(affects_version)
+        else:
+            milestone = ""
+
+        assignee = (fields.get("assignee") or {}).get("displayName") or "Unassigned"
 
         return {
             "key": issue.get("key", ""),
             "summary": fields.get("summary") or "",
-            "status": normalized_status,
+            "status": status_category,
             "due_date": fields.get("duedate"),
             "start_date": fields.get("customfield_10015"),
             "milestone": milestone,
             "assignee": assignee,
         }
 
-    def search_issues(
-        self,
-        jql: str,
-        max_results: int = 500,
-    ) -> List[Dict]:
+    def _to_milestone(self, issue: Dict) -> Dict:
         """
-        Search for issues using JQL query.
+        Convert an Epic issue to milestone format.
 
         Args:
-            jql: JQL query string
-            max_results: Maximum number of results to return
+            issue: Raw Jira Epic issue JSON
 
         Returns:
-            List of normalized issue dictionaries
+            Milestone dictionary with id, name, description and issue key
+        """
+        key = issue.get("key", "")
+        fields = issue.get("fields", {})
+        description = fields.get("description", "")
+
+        # Extract description text if it's a structured object
+        if isinstance(description, dict):
+            description = "".join(
+                text.get("text", "")
+                for item in description.get("content", [])
+                if item.get("type") == "paragraph"
+                for text in item.get("content", [])
+                if text.get("type") == "text"
+            )
 
-        Raises:
-            JiraAPIError: If search fails
+        return {
+            "id": key,
+            "name": fields.get("summary", ""),
+            "description": description or "",
+            "released": False,
+            "archived": False,
+            "key": key,  # Add the issue key for linking
+        }
+
+    def _search_raw(
+        self, jql: str, fields: str, max_results: int = 500
+    ) -> Iterator[Dict]:
         """
-        all_issues = []
-        start_at = 0
+        Run a JQL search and yield raw issues across all result pages.
 
-        logger.info(f"Starting issue search with JQL: {jql}")
+        The first page is fetched alone. If it reports a total, the remaining
+        pages are fetched concurrently and yielded in startAt order; otherwise
+        the nextPageToken chain is followed sequentially.
 
-        while True:
-            # Note: Using /rest/api/3/search/jql endpoint (new API)
+        At most PAGE_WORKERS pages are requested ahead of the consumer: the
+        next page is only submitted once a buffered page is handed out, so
+        memory stays bounded by a few pages rather than the whole result.
+
+        Args:
+            jql: JQL query string
+            fields: Comma-separated list of fields to retrieve
+            max_results: Maximum number of results to request
+
+        Yields:
+            Raw Jira issue dictionaries, in search result order
+
+        Raises:
+            JiraAPIError: If a page request fails
+        """
+        base_params = {"jql": jql, "fields": fields}
+
+        def fetch_page(start_at: int, size: int) -> Dict:
             params = {
-                "jql": jql,
-                "fields": ",".join(self.FIELDS),
-                "maxResults": min(50, max_results - len(all_issues)),
+                **base_params,
+                "maxResults": min(size, max_results - start_at),
                 "startAt": start_at,
             }
+            return self._make_request("GET", self._search_path, params=params)
+
+        page = fetch_page(0, self.PAGE_SIZE)
+        page_size = len(page.get("issues", []))
+        total = page.get("total")
+        yield from page.get("issues", [])
+
+        if page_size and total is None:
+            # Token-paginated response without a total: walk it sequentially
+            fetched = page_size
+            while (
+                not page.get("isLast", False)
+                and page.get("nextPageToken")
+                and fetched < max_results
+            ):
+                params = {
+                    **base_params,
+                    "maxResults": min(self.PAGE_SIZE, max_results - fetched),
+                    "nextPageToken": page["nextPageToken"],
+                }
+                page = self._make_request("GET", self._search_path, params=params)
+                issues = page.get("issues", [])
+                if not issues:
+                    break
+                fetched += len(issues)
+                yield from issues
+        elif page_size:
+            # The first page reveals the total: fetch the rest concurrently
+            # and yield them in startAt order as they complete. Later pages
+            # ask for exactly the first page's size (which may be below
+            # PAGE_SIZE if Jira capped it) so offsets never overlap.
+            page_starts = iter(range(page_size, min(total, max_results), page_size))
+            with ThreadPoolExecutor(max_workers=self.PAGE_WORKERS) as executor:
+                window = deque(
+                    executor.submit(fetch_page, start_at, page_size)
+                    for start_at in islice(page_starts, self.PAGE_WORKERS)
+                )
+                while window:
+                    page = window.popleft().result()
+                    # Refill the window before yielding so the next request
+                    # overlaps with the caller consuming this page
+                    start_at = next(page_starts, None)
+                    if start_at is not None:
+                        window.append(executor.submit(fetch_page, start_at, page_size))
+                    yield from page.get("issues", [])
+
+    def iter_issues(
+        self,
+        jql: str,
+        max_results: int = 500,
+    ) -> Iterator[NormalizedIssue]:
+        """
+        Iterate over issues matching a JQL query.
 
-            try:
-                endpoint = self.SEARCH_ENDPOINT.format(version=self.API_VERSION)
-                response = self._make_request("GET", endpoint, params=params)
+        Issues are normalized and yielded page by page as responses arrive.
+        Only a bounded window of pages (see _search_raw) is fetched ahead of
+        the caller, so a partially consumed search never buffers the whole
+        result.
 
-                issues = response.get("issues", [])
+        Args:
+            jql: JQL query string
+            max_results: Maximum number of results to return
 
-                if not issues:
-                    break
+        Yields:
+            Normalized issue dictionaries, in search result order
 
-                # Normalize and add issues
-                for issue in issues:
-                    normalized = self._normalize_issue(issue)
-                    all_issues.append(normalized)
-                    logger.debug(f"Retrieved issue: {normalized['key']}")
+        Raises:
+            JiraAPIError: If search fails
+        """
+        logger.info(f"Starting issue search with JQL: {jql}")
 
-                # Check if we have all results
-                total = response.get("total", 0)
-                if len(all_issues) >= total or len(all_issues) >= max_results:
-                    break
+        try:
+            for issue in self._search_raw(jql, self._fields_csv, max_results):
+                normalized = self._normalize_issue(issue)
+                # Lazy %-formatting: no string is built unless DEBUG is enabled
+                logger.debug("Retrieved issue: %s", normalized["key"])
+                yield normalized
+
+        except JiraAPIError as e:
+            logger.error(f"Error during issue search: {e}")
+            raise
+
+    def search_issues(
+        self,
+        jql: str,
+        max_results: int = 500,
+    ) -> List[NormalizedIssue]:
+        """
+        Search for issues using JQL query.
 
-                start_at += len(issues)
+        Args:
+            jql: JQL query string
+            max_results: Maximum number of results to return
 
-            except JiraAPIError as e:
-                logger.error(f"Error during issue search: {e}")
-                raise
+        Returns:
+            List of normalized issue dictionaries
 
+        Raises:
+            JiraAPIError: If search fails
+        """
+        all_issues = list(islice(self.iter_issues(jql, max_results), max_results))
         logger.info(f"Retrieved {len(all_issues)} issues")
         return all_issues
 
@@ -298,6 +532,9 @@ class JiraClient:
         
         In this project, milestones are represented as Epic issues (e.g., WT-1421 "Milestone 2").
 
+        Results are cached per project key for VERSIONS_CACHE_TTL seconds, so
+        repeated calls do not hit the API again; see invalidate_versions().
+
         Args:
             project_key: Jira project key
 
@@ -307,51 +544,25 @@ class JiraClient:
         Raises:
             JiraAPIError: If request fails
         """
+        cached = self._versions_cache.get(project_key)
+        if cached is not None:
+            fetched_at, milestones = cached
+            if time.monotonic() - fetched_at < self.VERSIONS_CACHE_TTL:
+                logger.debug(f"Using cached milestones for project: {project_key}")
+                return milestones
+
         logger.info(f"Fetching milestones (Epic issues) for project: {project_key}")
 
         try:
             # Search for all open Epic issues
-            params = {
-                "jql": f'project = "{project_key}" AND type = Epic AND statusCategory != "Done"',
-                "fields": "key,summary,description",
-                "maxResults": 500,
-            }
-            
-            endpoint = self.SEARCH_ENDPOINT.format(version=self.API_VERSION)
-            response = self._make_request("GET", endpoint, params=params)
-            
-            issues = response.get("issues", [])
-            
-            # Convert Epic issues to milestone format
-            milestones = []
-            for issue in issues:
-                key = issue.get("key", "")
-                fields = issue.get("fields", {})
-                summary = fields.get("summary", "")
-                description = fields.get("description", "")
-                
-                # Extract description text if it's a structured object
-                if isinstance(description, dict):
-                    content = description.get("content", [])
-                    desc_text = ""
-                    for item in content:
-                        if item.get("type") == "paragraph":
-                            text_items = item.get("content", [])
-                            for text in text_items:
-                                if text.get("type") == "text":
-                                    desc_text += text.get("text", "")
-                    description = desc_text
-                
-                milestones.append({
-                    "id": key,
-                    "name": summary,
-                    "description": description or "",
-                    "released": False,
-                    "archived": False,
-                    "key": key,  # Add the issue key for linking
-                })
-            
+            jql = f'project = "{project_key}" AND type = Epic AND statusCategory != "Done"'
+            milestones = [
+                self._to_milestone(issue)
+                for issue in self._search_raw(jql, self._milestone_fields_csv)
+            ]
+
             logger.info(f"Retrieved {len(milestones)} milestones (Epic issues) for project {project_key}")
+            self._versions_cache[project_key] = (time.monotonic(), milestones)
             return milestones
 
         except JiraAPIError as e:
@@ -21,13 +21,17 @@ Environment Variables:
     OUTPUT_DIR: Output directory (optional, default: ./output)
     TIMELINE_TITLE: Report title (required)
     START_DATE_FIELD: Custom start date field (optional)
+    INCREMENTAL_FETCH: Cache issues between runs and only fetch updated ones
+        (optional, default: false)
 """
 
 import logging
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
-
-from dotenv import load_dotenv
+from typing import Dict, List, Optional
 
 # Ensure project root is on sys.path so `from src.*` works when running
 # `python src/jira_milestone_reporter.py` directly.
@@ -39,6 +43,11 @@ if PROJECT_ROOT not in sys.path:
 from src.config import Config
 from src.jira_client import JiraClient, JiraClientError
 from src.html_renderer import HTMLRenderer
+from src.issue_cache import IssueCache
+
+
+# Concurrent milestone issue searches (kept low to stay clear of Jira rate limits)
+MAX_FETCH_WORKERS = 5
 
 
 def setup_logging(level: int = logging.INFO) -> logging.Logger:
@@ -58,13 +67,39 @@ def setup_logging(level: int = logging.INFO) -> logging.Logger:
     return logging.getLogger(__name__)
 
 
+def _fetch_milestone_issues(
+    client: JiraClient,
+    project_key: str,
+    milestone: Dict,
+    updated_within_minutes: Optional[int] = None,
+) -> List[Dict]:
+    """Fetch the issues linked to an Epic milestone.
+
+    Args:
+        client: Jira client
+        project_key: Jira project key
+        milestone: Milestone dictionary with the Epic key
+        updated_within_minutes: Only fetch issues updated in the last N
+            minutes (default: fetch all issues)
+
+    Returns:
+        List of normalized issue dictionaries
+    """
+    jql = f'project = "{project_key}" AND "Epic Link" = {milestone.get("key", "")}'
+    if updated_within_minutes is not None:
+        jql += f" AND updated >= -{updated_within_minutes}m"
+    return client.search_issues(jql)
+
+
 def main() -> int:
     """Main entry point for the application.
 
     Returns:
         Exit code (0 for success, 1 for failure)
     """
-    # Load .env file
+    # Load .env file (imported here to keep module import cheap)
+    from dotenv import load_dotenv
+
     env_path = Path(__file__).parent.parent / ".env"
     load_dotenv(dotenv_path=env_path)
 
@@ -82,103 +117,140 @@ def main() -> int:
         logger.debug(f"Configuration: {config.to_dict()}")
 
         output_dir = Path(config.output_dir)
-        client = JiraClient(
+        # The client's pooled connections are released when the block exits
+        with JiraClient(
             config.jira_base_url, config.jira_username, config.jira_api_token
-        )
-        renderer = HTMLRenderer(config.jira_base_url, config.timeline_title)
-        logger.info("✓ Configuration and client initialized")
-
-        # Phase 2: Fetch all project versions
-        logger.info("Phase 2: Fetching project versions...")
-        try:
-            versions = client.get_project_versions(config.jira_project_key)
-            logger.info(f"Retrieved {len(versions)} versions from project")
-        except JiraClientError as e:
-            logger.error(f"Failed to fetch versions: {e}")
-            return 1
-
-        # Phase 3: Filter to open milestones
-        logger.info("Phase 3: Filtering open milestones...")
-        open_milestones = [
-            v for v in versions if not v.get("released") and not v.get("archived")
-        ]
-        logger.info(f"Found {len(open_milestones)} open milestones")
-
-        if not open_milestones:
-            logger.warning("No open milestones found")
-            return 0
-
-        # Phase 4: Generate milestone reports
-        logger.info("Phase 4: Generating milestone reports...")
-        milestones_with_issues = []
-
-        for milestone in open_milestones:
-            milestone_name = milestone.get("name", "Unknown")
-            milestone_key = milestone.get("key", "")
-            logger.info(f"  Processing milestone: {milestone_name} ({milestone_key})")
-
-            try:
-                # Fetch issues linked to this Epic milestone
-                jql = (
-                    f'project = "{config.jira_project_key}" '
-                    f'AND "Epic Link" = {milestone_key}'
-                )
-                issues = client.search_issues(jql)
-                logger.debug(f"    Retrieved {len(issues)} issues")
-
-                # Skip milestones with no issues
-                if not issues:
-                    logger.info(f"    Skipping milestone {milestone_name} (0 issues)")
-                    continue
-
-                # Prepare issue data
-                formatted_issues = [
-                    {
-                        "key": issue.get("key"),
-                        "summary": issue.get("summary"),
-                        "status": issue.get("status"),
-                        "due_date": issue.get("due_date", ""),
-                        "start_date": issue.get("start_date", ""),
-                        "assignee": issue.get("assignee", "Unassigned"),
-                    }
-                    for issue in issues
-                ]
-
-                # Generate HTML report for this milestone
-                renderer.render_milestone_report(milestone, formatted_issues, output_dir)
-                logger.info(f"    ✓ Generated report for {milestone_name}")
-
-                # Track milestone for index
-                milestones_with_issues.append(
-                    {
-                        "id": milestone.get("id"),
-                        "name": milestone_name,
-                        "description": milestone.get("description", ""),
-                        "issue_count": len(formatted_issues),
-                        "key": milestone_key,
-                    }
+        ) as client:
+            renderer = HTMLRenderer(config.jira_base_url, config.timeline_title)
+            # Every page of this run shares the same generation timestamp
+            generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            logger.info("✓ Configuration and client initialized")
+
+            # Optional on-disk cache: warm runs only fetch recently updated issues
+            cache = None
+            if config.incremental_enabled():
+                cache = IssueCache(output_dir / ".cache")
+                cache.load()
+                logger.info(
+                    f"Incremental fetch enabled (cache: {cache.path}, "
+                    f"warm: {cache.last_run is not None})"
                 )
 
+            # Phase 2: Fetch all project versions
+            logger.info("Phase 2: Fetching project versions...")
+            try:
+                versions = client.get_project_versions(config.jira_project_key)
+                logger.info(f"Retrieved {len(versions)} versions from project")
             except JiraClientError as e:
-                logger.error(f"  Failed to fetch issues for {milestone_name}: {e}")
-                continue
+                logger.error(f"Failed to fetch versions: {e}")
+                return 1
+
+            # Phase 3: Filter to open milestones
+            logger.info("Phase 3: Filtering open milestones...")
+            open_milestones = [
+                v for v in versions if not v.get("released") and not v.get("archived")
+            ]
+            logger.info(f"Found {len(open_milestones)} open milestones")
+
+            if not open_milestones:
+                logger.warning("No open milestones found")
+                return 0
+
+            # Phase 4: Generate milestone reports
+            logger.info("Phase 4: Generating milestone reports...")
+            index_entries: Dict[int, Dict] = {}
+            refreshed_keys: List[str] = []
+            # Anything updated after this instant is picked up by the next run
+            run_started = time.time()
+
+            # Issue searches are network-bound, so fetch milestones concurrently and
+            # render each report on the main thread as its issues arrive.
+            with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+                futures = {}
+                for position, milestone in enumerate(open_milestones):
+                    logger.info(
+                        f"  Processing milestone: {milestone.get('name', 'Unknown')} "
+                        f"({milestone.get('key', '')})"
+                    )
+                    window = (
+                        cache.updated_within_minutes(milestone.get("key", ""), run_started)
+                        if cache is not None
+                        else None
+                    )
+                    future = executor.submit(
+                        _fetch_milestone_issues,
+                        client,
+                        config.jira_project_key,
+                        milestone,
+                        window,
+                    )
+                    futures[future] = (position, window)
+
+                for future in as_completed(futures):
+                    position, window = futures[future]
+                    milestone = open_milestones[position]
+                    milestone_name = milestone.get("name", "Unknown")
+                    milestone_key = milestone.get("key", "")
+
+                    try:
+                        issues = future.result()
+                        logger.debug(f"    Retrieved {len(issues)} issues")
+
+                        if cache is not None:
+                            issues = cache.merge(
+                                milestone_key, issues, full=window is None
+                            )
+                            refreshed_keys.append(milestone_key)
+
+                        # Skip milestones with no issues
+                        if not issues:
+                            logger.info(f"    Skipping milestone {milestone_name} (0 issues)")
+                            continue
+
+                        # Generate HTML report for this milestone; normalized issues
+                        # already carry every field the renderer reads
+                        renderer.render_milestone_report(
+                            milestone, issues, output_dir, generated_at
+                        )
+                        logger.info(f"    ✓ Generated report for {milestone_name}")
+
+                        # Track milestone for index, keeping the original order
+                        index_entries[position] = {
+                            "id": milestone.get("id"),
+                            "name": milestone_name,
+                            "description": milestone.get("description", ""),
+                            "issue_count": len(issues),
+                            "key": milestone_key,
+                        }
+
+                    except JiraClientError as e:
+                        logger.error(f"  Failed to fetch issues for {milestone_name}: {e}")
+                        continue
+                    except Exception as e:
+                        logger.error(f"  Failed to generate report for {milestone_name}: {e}")
+                        continue
+
+            milestones_with_issues = [index_entries[i] for i in sorted(index_entries)]
+
+            if cache is not None:
+                try:
+                    cache.save(run_started, refreshed_keys)
+                except OSError as e:
+                    logger.warning(f"Failed to write issue cache: {e}")
+
+            # Phase 5: Generate index
+            logger.info("Phase 5: Generating index.html...")
+            try:
+                renderer.render_index(milestones_with_issues, output_dir, generated_at)
+                logger.info("✓ Generated index.html")
             except Exception as e:
-                logger.error(f"  Failed to generate report for {milestone_name}: {e}")
-                continue
-
-        # Phase 5: Generate index
-        logger.info("Phase 5: Generating index.html...")
-        try:
-            renderer.render_index(milestones_with_issues, output_dir)
-            logger.info("✓ Generated index.html")
-        except Exception as e:
-            logger.error(f"Failed to generate index: {e}")
-            return 1
+                logger.error(f"Failed to generate index: {e}")
+                return 1
 
-        logger.info("=" * 70)
-        logger.info(f"✓ Success! Reports generated in: {output_dir.resolve()}")
-        logger.info("=" * 70)
-        return 0
+            logger.info("=" * 70)
+            logger.info(f"✓ Success! Reports generated in: {output_dir.resolve()}")
+            logger.info("=" * 70)
+            return 0
 
     except ValueError as e:
         logger.error(f"Configuration error: {e}")
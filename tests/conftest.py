@@ -2,9 +2,66 @@
 Pytest configuration and fixtures for Jira Timeline Generator tests.
 """
 
+import json
 import sys
 from pathlib import Path
+from urllib.parse import parse_qs, urlparse
 
 # Add src to path for imports
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
+
+import pytest
+import responses
+
+from jira_client import JiraClient
+
+SEARCH_URL = "https://test.atlassian.net/rest/api/3/search/jql"
+
+
+@pytest.fixture
+def jira_client():
+    """JiraClient for the mocked test.atlassian.net instance."""
+    return JiraClient(
+        base_url="https://test.atlassian.net",
+        username="user@example.com",
+        api_token="token",
+    )
+
+
+@pytest.fixture
+def register_search():
+    """Register a mocked JQL search response (use with @responses.activate)."""
+
+    def _register(payload, status=200, **kwargs):
+        responses.add(responses.GET, SEARCH_URL, json=payload, status=status, **kwargs)
+
+    return _register
+
+
+@pytest.fixture
+def register_paged_search():
+    """Register a mocked JQL search serving `total` issues page by page.
+
+    Pages honour the requested startAt/maxResults. page_cap caps every page
+    and first_page_cap only the first one, like a server trimming results.
+    """
+
+    def _register(total, page_cap=None, first_page_cap=None):
+        def page_callback(request):
+            query = parse_qs(urlparse(request.url).query)
+            start_at = int(query["startAt"][0])
+            page_size = int(query["maxResults"][0])
+            if page_cap is not None:
+                page_size = min(page_size, page_cap)
+            if start_at == 0 and first_page_cap is not None:
+                page_size = min(page_size, first_page_cap)
+            issues = [
+                {"key": f"TEST-{i}", "fields": {"summary": f"Issue {i}"}}
+                for i in range(start_at, min(start_at + page_size, total))
+            ]
+            return (200, {}, json.dumps({"total": total, "issues": issues}))
+
+        responses.add_callback(responses.GET, SEARCH_URL, callback=page_callback)
+
+    return _register
@@ -6,21 +6,34 @@ import pytest
 from config import Config
 
 
+@pytest.fixture
+def base_env(monkeypatch):
+    """Set a complete, valid baseline environment for Config.
+
+    Tests override or delete individual variables with monkeypatch.
+    """
+    env_vars = {
+        "JIRA_BASE_URL": "https://test.atlassian.net",
+        "JIRA_USERNAME": "user@example.com",
+        "JIRA_API_TOKEN": "test_token",
+        "JIRA_PROJECT_KEY": "TEST",
+        "TIMELINE_TITLE": "Test Timeline",
+    }
+    for key, value in env_vars.items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.delenv("OUTPUT_DIR", raising=False)
+    monkeypatch.delenv("START_DATE_FIELD", raising=False)
+    monkeypatch.delenv("INCREMENTAL_FETCH", raising=False)
+    return env_vars
+
+
 class TestConfig:
     """Test suite for Config class."""
 
-    def test_successful_loading_with_all_variables(self, monkeypatch):
+    def test_successful_loading_with_all_variables(self, base_env, monkeypatch):
         """Test successful configuration loading with all required variables."""
-        env_vars = {
-            "JIRA_BASE_URL": "https://test.atlassian.net",
-            "JIRA_USERNAME": "user@example.com",
-            "JIRA_API_TOKEN": "test_token_12345",
-            "JIRA_PROJECT_KEY": "TEST",
-            "OUTPUT_DIR": "./output",
-            "TIMELINE_TITLE": "Test Timeline",
-        }
-        for key, value in env_vars.items():
-            monkeypatch.setenv(key, value)
+        monkeypatch.setenv("JIRA_API_TOKEN", "test_token_12345")
+        monkeypatch.setenv("OUTPUT_DIR", "./output")
 
         config = Config()
         assert config.jira_base_url == "https://test.atlassian.net"
@@ -30,145 +43,50 @@ class TestConfig:
         assert config.output_dir == "./output"
         assert config.timeline_title == "Test Timeline"
 
-    def test_default_output_dir(self, monkeypatch):
+    def test_default_output_dir(self, base_env):
         """Test that default output directory is used when not provided."""
-        env_vars = {
-            "JIRA_BASE_URL": "https://test.atlassian.net",
-            "JIRA_USERNAME": "user@example.com",
-            "JIRA_API_TOKEN": "test_token",
-            "JIRA_PROJECT_KEY": "TEST",
-            "TIMELINE_TITLE": "Test Timeline",
-        }
-        for key, value in env_vars.items():
-            monkeypatch.setenv(key, value)
-        monkeypatch.delenv("OUTPUT_DIR", raising=False)
-
         config = Config()
         assert config.output_dir == "./output"
 
-    def test_missing_jira_base_url(self, monkeypatch):
-        """Test validation fails when JIRA_BASE_URL is missing."""
-        env_vars = {
-            "JIRA_USERNAME": "user@example.com",
-            "JIRA_API_TOKEN": "test_token",
-            "JIRA_PROJECT_KEY": "TEST",
-            "TIMELINE_TITLE": "Test Timeline",
-        }
-        for key, value in env_vars.items():
-            monkeypatch.setenv(key, value)
-        monkeypatch.delenv("JIRA_BASE_URL", raising=False)
+    @pytest.mark.parametrize(
+        "missing_var",
+        ["JIRA_BASE_URL", "JIRA_USERNAME", "JIRA_API_TOKEN", "JIRA_PROJECT_KEY"],
+    )
+    def test_missing_mandatory_variable(self, base_env, monkeypatch, missing_var):
+        """Test validation fails when a mandatory variable is missing."""
+        monkeypatch.delenv(missing_var, raising=False)
 
         config = Config()
         with pytest.raises(ValueError, match="Missing required environment variables"):
             config.validate()
 
-    def test_missing_jira_username(self, monkeypatch):
-        """Test validation fails when JIRA_USERNAME is missing."""
-        env_vars = {
-            "JIRA_BASE_URL": "https://test.atlassian.net",
-            "JIRA_API_TOKEN": "test_token",
-            "JIRA_PROJECT_KEY": "TEST",
-            "TIMELINE_TITLE": "Test Timeline",
-        }
-        for key, value in env_vars.items():
-            monkeypatch.setenv(key, value)
-        monkeypatch.delenv("JIRA_USERNAME", raising=False)
-
-        config = Config()
-        with pytest.raises(ValueError, match="Missing required environment variables"):
-            config.validate()
-
-    def test_missing_jira_api_token(self, monkeypatch):
-        """Test validation fails when JIRA_API_TOKEN is missing."""
-        env_vars = {
-            "JIRA_BASE_URL": "https://test.atlassian.net",
-            "JIRA_USERNAME": "user@example.com",
-            "JIRA_PROJECT_KEY": "TEST",
-            "TIMELINE_TITLE": "Test Timeline",
-        }
-        for key, value in env_vars.items():
-            monkeypatch.setenv(key, value)
-        monkeypatch.delenv("JIRA_API_TOKEN", raising=False)
-
-        config = Config()
-        with pytest.raises(ValueError, match="Missing required environment variables"):
-            config.validate()
-
-    def test_missing_jira_project_key(self, monkeypatch):
-        """Test validation fails when JIRA_PROJECT_KEY is missing."""
-        env_vars = {
-            "JIRA_BASE_URL": "https://test.atlassian.net",
-            "JIRA_USERNAME": "user@example.com",
-            "JIRA_API_TOKEN": "test_token",
-            "TIMELINE_TITLE": "Test Timeline",
-        }
-        for key, value in env_vars.items():
-            monkeypatch.setenv(key, value)
-        monkeypatch.delenv("JIRA_PROJECT_KEY", raising=False)
-
-        config = Config()
-        with pytest.raises(ValueError, match="Missing required environment variables"):
-            config.validate()
-
-    def test_timeline_title_optional(self, monkeypatch):
+    def test_timeline_title_optional(self, base_env, monkeypatch):
         """Test that TIMELINE_TITLE is optional with default value."""
-        env_vars = {
-            "JIRA_BASE_URL": "https://test.atlassian.net",
-            "JIRA_USERNAME": "user@example.com",
-            "JIRA_API_TOKEN": "test_token",
-            "JIRA_PROJECT_KEY": "TEST",
-        }
-        for key, value in env_vars.items():
-            monkeypatch.setenv(key, value)
         monkeypatch.delenv("TIMELINE_TITLE", raising=False)
 
         config = Config()
         config.validate()  # Should not raise
         assert config.timeline_title == "Jira Milestones Report"
 
-    def test_invalid_url_format(self, monkeypatch):
+    def test_invalid_url_format(self, base_env, monkeypatch):
         """Test validation fails with invalid URL format."""
-        env_vars = {
-            "JIRA_BASE_URL": "not-a-url",
-            "JIRA_USERNAME": "user@example.com",
-            "JIRA_API_TOKEN": "test_token",
-            "JIRA_PROJECT_KEY": "TEST",
-            "TIMELINE_TITLE": "Test Timeline",
-        }
-        for key, value in env_vars.items():
-            monkeypatch.setenv(key, value)
+        monkeypatch.setenv("JIRA_BASE_URL", "not-a-url")
 
         config = Config()
         with pytest.raises(ValueError, match="JIRA_BASE_URL must start with"):
             config.validate()
 
-    def test_valid_http_url(self, monkeypatch):
+    def test_valid_http_url(self, base_env, monkeypatch):
         """Test that HTTP URLs are accepted."""
-        env_vars = {
-            "JIRA_BASE_URL": "http://test.example.com",
-            "JIRA_USERNAME": "user@example.com",
-            "JIRA_API_TOKEN": "test_token",
-            "JIRA_PROJECT_KEY": "TEST",
-            "TIMELINE_TITLE": "Test Timeline",
-        }
-        for key, value in env_vars.items():
-            monkeypatch.setenv(key, value)
+        monkeypatch.setenv("JIRA_BASE_URL", "http://test.example.com")
 
         config = Config()
         config.validate()  # Should not raise
         assert config.jira_base_url == "http://test.example.com"
 
-    def test_to_dict_masks_api_token(self, monkeypatch):
+    def test_to_dict_masks_api_token(self, base_env, monkeypatch):
         """Test that to_dict() masks the API token."""
-        env_vars = {
-            "JIRA_BASE_URL": "https://test.atlassian.net",
-            "JIRA_USERNAME": "user@example.com",
-            "JIRA_API_TOKEN": "secret_token_12345",
-            "JIRA_PROJECT_KEY": "TEST",
-            "TIMELINE_TITLE": "Test Timeline",
-        }
-        for key, value in env_vars.items():
-            monkeypatch.setenv(key, value)
+        monkeypatch.setenv("JIRA_API_TOKEN", "secret_token_12345")
 
         config = Config()
         config_dict = config.to_dict()
@@ -176,16 +94,8 @@ class TestConfig:
         assert config_dict["jira_api_token"] == "***"
         assert config_dict["jira_username"] == "user@example.com"
 
-    def test_to_dict_with_empty_token(self, monkeypatch):
+    def test_to_dict_with_empty_token(self, base_env, monkeypatch):
         """Test that to_dict() handles missing token gracefully."""
-        env_vars = {
-            "JIRA_BASE_URL": "https://test.atlassian.net",
-            "JIRA_USERNAME": "user@example.com",
-            "JIRA_PROJECT_KEY": "TEST",
-            "TIMELINE_TITLE": "Test Timeline",
-        }
-        for key, value in env_vars.items():
-            monkeypatch.setenv(key, value)
         monkeypatch.delenv("JIRA_API_TOKEN", raising=False)
 
         config = Config()
@@ -193,17 +103,10 @@ class TestConfig:
 
         assert config_dict["jira_api_token"] == ""
 
-    def test_whitespace_trimming(self, monkeypatch):
+    def test_whitespace_trimming(self, base_env, monkeypatch):
         """Test that leading/trailing whitespace is trimmed."""
-        env_vars = {
-            "JIRA_BASE_URL": "  https://test.atlassian.net  ",
-            "JIRA_USERNAME": "  user@example.com  ",
-            "JIRA_API_TOKEN": "  test_token  ",
-            "JIRA_PROJECT_KEY": "  TEST  ",
-            "TIMELINE_TITLE": "  Test Timeline  ",
-        }
-        for key, value in env_vars.items():
-            monkeypatch.setenv(key, value)
+        for key, value in base_env.items():
+            monkeypatch.setenv(key, f"  {value}  ")
 
         config = Config()
         assert config.jira_base_url == "https://test.atlassian.net"
@@ -212,18 +115,21 @@ class TestConfig:
         assert config.jira_project_key == "TEST"
         assert config.timeline_title == "Test Timeline"
 
-    def test_validate_success(self, monkeypatch):
+    def test_validate_success(self, base_env):
         """Test that validate() returns None on success."""
-        env_vars = {
-            "JIRA_BASE_URL": "https://test.atlassian.net",
-            "JIRA_USERNAME": "user@example.com",
-            "JIRA_API_TOKEN": "test_token",
-            "JIRA_PROJECT_KEY": "TEST",
-            "TIMELINE_TITLE": "Test Timeline",
-        }
-        for key, value in env_vars.items():
-            monkeypatch.setenv(key, value)
-
         config = Config()
         result = config.validate()
         assert result is None
+
+    def test_incremental_fetch_disabled_by_default(self, base_env):
+        """Test that incremental fetching is off unless requested."""
+        config = Config()
+        assert config.incremental_enabled() is False
+
+    @pytest.mark.parametrize("value", ["true", "1", "YES", " on "])
+    def test_incremental_fetch_enabled(self, base_env, monkeypatch, value):
+        """Test that truthy INCREMENTAL_FETCH values enable the issue cache."""
+        monkeypatch.setenv("INCREMENTAL_FETCH", value)
+
+        config = Config()
+        assert config.incremental_enabled() is True
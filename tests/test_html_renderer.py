@@ -1,8 +1,10 @@
 """Unit tests for html_renderer.py module."""
 
+import re
+
 import pytest
 from pathlib import Path
-from html_renderer import HTMLRenderer
+from html_renderer import HTMLRenderer, _escape
 
 
 class TestHTMLRendererInitialization:
@@ -24,6 +26,20 @@ class TestHTMLRendererInitialization:
         assert renderer.base_url == "https://test.atlassian.net"
 
 
+    def test_ensure_dir_creates_directory_once(self, tmp_path):
+        """Test that the output directory is created and remembered."""
+        renderer = HTMLRenderer(
+            base_url="https://test.atlassian.net", title="Test"
+        )
+        output_dir = tmp_path / "nested" / "output"
+
+        renderer._ensure_dir(output_dir)
+        renderer._ensure_dir(output_dir)
+
+        assert output_dir.is_dir()
+        assert renderer._ensured_dirs == {output_dir}
+
+
 class TestHTMLRendererSlugify:
     """Test suite for _slugify method."""
 
@@ -44,6 +60,11 @@ class TestHTMLRendererSlugify:
         renderer = HTMLRenderer(base_url="https://test.atlassian.net", title="Test")
         assert renderer._slugify("Q1/2025") == "q1-2025"
 
+    def test_slugify_mixed_spaces_and_slashes(self):
+        """Test that spaces and slashes are replaced in the same pass."""
+        renderer = HTMLRenderer(base_url="https://test.atlassian.net", title="Test")
+        assert renderer._slugify("Q1 / 2025 Release") == "q1_-_2025_release"
+
 
 class TestHTMLRendererIssueUrl:
     """Test suite for _get_issue_url method."""
@@ -71,6 +92,21 @@ class TestHTMLRendererIssueUrl:
         )
 
 
+class TestHTMLRendererEscape:
+    """Test suite for _escape helper."""
+
+    def test_escape_safe_text_unchanged(self):
+        """Test that text without HTML-special characters is returned as-is."""
+        text = "Implement feature 42"
+        assert _escape(text) is text
+
+    def test_escape_special_characters(self):
+        """Test that HTML-special characters are escaped."""
+        assert _escape('<b>"A" & \'B\'</b>') == (
+            "&lt;b&gt;&quot;A&quot; &amp; &#x27;B&#x27;&lt;/b&gt;"
+        )
+
+
 class TestHTMLRendererIndex:
     """Test suite for render_index method."""
 
@@ -119,6 +155,17 @@ class TestHTMLRendererIndex:
 
         assert index_file.exists()
 
+    def test_render_index_uses_given_timestamp(self, tmp_path):
+        """Test that a caller-supplied generation timestamp is rendered."""
+        renderer = HTMLRenderer(
+            base_url="https://test.atlassian.net", title="Test"
+        )
+
+        output_path = renderer.render_index([], tmp_path, "2025-01-02 03:04:05")
+
+        content = output_path.read_text()
+        assert "Generated by Jira Milestone Reporter on 2025-01-02 03:04:05" in content
+
 
 class TestHTMLRendererMilestoneReport:
     """Test suite for render_milestone_report method."""
@@ -226,6 +273,25 @@ class TestHTMLRendererMilestoneReport:
         assert "status-orange" in content  # In Progress
         assert "status-gray" in content  # To Do
 
+    def test_render_milestone_groups_issues_by_status(self, tmp_path):
+        """Test that rows are grouped To Do, In Progress, Done, stably."""
+        renderer = HTMLRenderer(
+            base_url="https://test.atlassian.net", title="Test"
+        )
+        milestone = {"id": "M1", "name": "test", "description": "Test"}
+        statuses = ["Done", "To Do", "In Progress", "Blocked", "Done", "To Do"]
+        issues = [
+            {"key": f"TEST-{i}", "summary": "", "status": status}
+            for i, status in enumerate(statuses)
+        ]
+
+        output_path = renderer.render_milestone_report(milestone, issues, tmp_path)
+
+        content = output_path.read_text()
+        row_keys = re.findall(r'target="_blank">(TEST-\d+)</a>', content)
+        assert row_keys == ["TEST-1", "TEST-3", "TEST-5", "TEST-2", "TEST-0", "TEST-4"]
+        assert '<span class="status status-gray">Blocked</span>' in content
+
     def test_render_milestone_issue_links(self, tmp_path):
         """Test that issue keys are linked to Jira."""
         renderer = HTMLRenderer(
@@ -250,6 +316,31 @@ class TestHTMLRendererMilestoneReport:
         assert "https://test.atlassian.net/browse/PROJ-42" in content
         assert 'target="_blank"' in content
 
+    def test_render_milestone_escapes_issue_fields(self, tmp_path):
+        """Test that user-controlled issue fields are HTML-escaped."""
+        renderer = HTMLRenderer(
+            base_url="https://test.atlassian.net", title="Test"
+        )
+        milestone = {"id": "TEST-100", "name": "R&D", "description": "Test"}
+        issues = [
+            {
+                "key": "TEST-1",
+                "summary": "<script>alert(1)</script>",
+                "status": "Done",
+                "due_date": "",
+                "start_date": "",
+                "assignee": "O'Brien",
+            }
+        ]
+
+        output_path = renderer.render_milestone_report(milestone, issues, tmp_path)
+
+        content = output_path.read_text()
+        assert "<script>" not in content
+        assert "&lt;script&gt;alert(1)&lt;/script&gt;" in content
+        assert "O&#x27;Brien" in content
+        assert "<h1>R&amp;D</h1>" in content
+
 
 class TestHTMLRendererIntegration:
     """Integration tests for HTML rendering."""
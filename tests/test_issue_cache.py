@@ -0,0 +1,89 @@
+"""
+Unit tests for issue_cache.py module.
+"""
+
+import json
+
+from issue_cache import IssueCache
+
+
+def _issue(key, status="To Do"):
+    """Build a minimal normalized issue."""
+    return {"key": key, "summary": f"Summary {key}", "status": status}
+
+
+class TestIssueCache:
+    """Test suite for IssueCache."""
+
+    def test_cold_cache_requires_full_fetch(self, tmp_path):
+        """Test that an empty cache asks for a full fetch."""
+        cache = IssueCache(tmp_path)
+        cache.load()
+
+        assert cache.last_run is None
+        assert cache.updated_within_minutes("WT-1") is None
+
+    def test_roundtrip_and_incremental_window(self, tmp_path):
+        """Test that a saved cache yields an updated-since window on reload."""
+        cache = IssueCache(tmp_path)
+        cache.load(now=1000.0)
+        cache.merge("WT-1", [_issue("WT-10"), _issue("WT-11")], full=True)
+        cache.save(1000.0, ["WT-1"])
+
+        warm = IssueCache(tmp_path)
+        warm.load(now=1000.0 + 3600)
+        window = warm.updated_within_minutes("WT-1", now=1000.0 + 3600)
+
+        assert window == 60 + IssueCache.SAFETY_MARGIN_MINUTES
+        # Milestones absent from the cache still need a full fetch
+        assert warm.updated_within_minutes("WT-2", now=1000.0 + 3600) is None
+
+    def test_incremental_merge_updates_and_keeps_cached_issues(self, tmp_path):
+        """Test that fresh issues replace cached ones by key."""
+        cache = IssueCache(tmp_path)
+        cache.merge("WT-1", [_issue("WT-10"), _issue("WT-11")], full=True)
+
+        merged = cache.merge("WT-1", [_issue("WT-11", "Done")], full=False)
+
+        assert [i["key"] for i in merged] == ["WT-10", "WT-11"]
+        assert merged[1]["status"] == "Done"
+
+    def test_full_merge_replaces_cached_issues(self, tmp_path):
+        """Test that a full fetch drops issues no longer in the milestone."""
+        cache = IssueCache(tmp_path)
+        cache.merge("WT-1", [_issue("WT-10"), _issue("WT-11")], full=True)
+
+        merged = cache.merge("WT-1", [_issue("WT-11")], full=True)
+
+        assert [i["key"] for i in merged] == ["WT-11"]
+
+    def test_save_keeps_only_refreshed_milestones(self, tmp_path):
+        """Test that milestones not refreshed this run are dropped."""
+        cache = IssueCache(tmp_path)
+        cache.merge("WT-1", [_issue("WT-10")], full=True)
+        cache.merge("WT-2", [_issue("WT-20")], full=True)
+        cache.save(1000.0, ["WT-2"])
+
+        data = json.loads(cache.path.read_bytes())
+        assert list(data["milestones"]) == ["WT-2"]
+
+    def test_expired_cache_is_ignored(self, tmp_path):
+        """Test that a cache past the full refresh age is discarded."""
+        cache = IssueCache(tmp_path)
+        cache.merge("WT-1", [_issue("WT-10")], full=True)
+        cache.save(1000.0, ["WT-1"])
+
+        stale = IssueCache(tmp_path)
+        stale.load(now=1000.0 + IssueCache.FULL_REFRESH_SECONDS + 1)
+
+        assert stale.last_run is None
+        assert stale.updated_within_minutes("WT-1") is None
+
+    def test_corrupt_cache_is_ignored(self, tmp_path):
+        """Test that an unreadable cache file falls back to a full fetch."""
+        (tmp_path / IssueCache.FILENAME).write_text("{not json")
+
+        cache = IssueCache(tmp_path)
+        cache.load()
+
+        assert cache.last_run is None
@@ -3,7 +3,10 @@ Unit tests for jira_client.py module.
 """
 
 import base64
+import time
+from itertools import islice
 from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 import responses
@@ -11,6 +14,11 @@ import responses
 from jira_client import JiraClient, JiraAuthError, JiraAPIError
 
 
+def _query(call):
+    """Parsed query string of a recorded responses call."""
+    return parse_qs(urlparse(call.request.url).query)
+
+
 class TestJiraClientInitialization:
     """Test suite for JiraClient initialization."""
 
@@ -55,6 +63,31 @@ class TestJiraClientInitialization:
                 api_token="",
             )
 
+    def test_session_pool_sized_for_concurrency(self):
+        """Test that the HTTPS adapter keeps enough pooled connections."""
+        client = JiraClient(
+            base_url="https://test.atlassian.net",
+            username="user@example.com",
+            api_token="test_token",
+        )
+
+        adapter = client.session.get_adapter("https://test.atlassian.net")
+        assert adapter._pool_maxsize == JiraClient.POOL_MAXSIZE
+
+    def test_context_manager_closes_session(self):
+        """Test that leaving the context closes the underlying session."""
+        client = JiraClient(
+            base_url="https://test.atlassian.net",
+            username="user@example.com",
+            api_token="test_token",
+        )
+
+        with patch.object(client.session, "close") as mock_close:
+            with client as entered:
+                assert entered is client
+
+        mock_close.assert_called_once()
+
 
 class TestJiraClientAuthentication:
     """Test suite for authentication header creation."""
@@ -77,19 +110,31 @@ class TestJiraClientAuthentication:
         expected_creds = base64.b64encode(b"user@example.com:my_token_123").decode()
         assert header["Authorization"] == f"Basic {expected_creds}"
 
-
-class TestJiraClientSearchIssues:
-    """Test suite for issue searching."""
-
     @responses.activate
-    def test_search_issues_single_page(self):
-        """Test searching issues that fit in a single page."""
+    def test_requests_send_auth_and_accept_headers(self, register_search):
+        """Test that every request carries the precomputed headers."""
         client = JiraClient(
             base_url="https://test.atlassian.net",
             username="user@example.com",
-            api_token="token",
+            api_token="my_token_123",
         )
 
+        register_search({"total": 0, "issues": []})
+
+        client.search_issues('project = "TEST"')
+
+        expected_creds = base64.b64encode(b"user@example.com:my_token_123").decode()
+        request_headers = responses.calls[0].request.headers
+        assert request_headers["Authorization"] == f"Basic {expected_creds}"
+        assert request_headers["Accept"] == "application/json"
+
+
+class TestJiraClientSearchIssues:
+    """Test suite for issue searching."""
+
+    @responses.activate
+    def test_search_issues_single_page(self, jira_client, register_search):
+        """Test searching issues that fit in a single page."""
         # Mock API response
         mock_response = {
             "total": 2,
@@ -115,14 +160,9 @@ class TestJiraClientSearchIssues:
             ],
         }
 
-        responses.add(
-            responses.GET,
-            "https://test.atlassian.net/rest/api/3/search/jql",
-            json=mock_response,
-            status=200,
-        )
+        register_search(mock_response)
 
-        issues = client.search_issues('project = "TEST"')
+        issues = jira_client.search_issues('project = "TEST"')
 
         assert len(issues) == 2
         assert issues[0]["key"] == "TEST-1"
@@ -132,19 +172,11 @@ class TestJiraClientSearchIssues:
         assert issues[0]["start_date"] == "2025-01-01"
 
     @responses.activate
-    def test_search_issues_pagination(self):
+    def test_search_issues_pagination(self, jira_client, register_search):
         """Test searching issues with pagination."""
-        client = JiraClient(
-            base_url="https://test.atlassian.net",
-            username="user@example.com",
-            api_token="token",
-        )
-
         # First page
-        responses.add(
-            responses.GET,
-            "https://test.atlassian.net/rest/api/3/search/jql",
-            json={
+        register_search(
+            {
                 "total": 3,
                 "issues": [
                     {
@@ -158,14 +190,11 @@ class TestJiraClientSearchIssues:
                     },
                 ],
             },
-            status=200,
         )
 
         # Second page
-        responses.add(
-            responses.GET,
-            "https://test.atlassian.net/rest/api/3/search/jql",
-            json={
+        register_search(
+            {
                 "total": 3,
                 "issues": [
                     {
@@ -179,86 +208,217 @@ class TestJiraClientSearchIssues:
                     },
                 ],
             },
-            status=200,
         )
 
-        issues = client.search_issues('project = "TEST"', max_results=500)
+        issues = jira_client.search_issues('project = "TEST"', max_results=500)
 
         # Note: Pagination stops after second response due to mock setup
         assert len(issues) >= 2
         assert issues[0]["key"] == "TEST-1"
 
     @responses.activate
-    def test_search_issues_http_error_401(self):
-        """Test handling of 401 Unauthorized error."""
-        client = JiraClient(
-            base_url="https://test.atlassian.net",
-            username="user@example.com",
-            api_token="bad_token",
+    def test_search_issues_concurrent_pages_keep_order(
+        self, jira_client, register_paged_search
+    ):
+        """Test that pages fetched after the first one are returned in order."""
+        register_paged_search(7, page_cap=2)
+
+        issues = jira_client.search_issues('project = "TEST"')
+
+        assert [issue["key"] for issue in issues] == [f"TEST-{i}" for i in range(7)]
+        assert len(responses.calls) == 4
+
+    @responses.activate
+    def test_search_issues_concurrent_pages_respect_max_results(
+        self, jira_client, register_paged_search
+    ):
+        """Test that concurrent page requests stop at max_results."""
+        register_paged_search(250)
+
+        issues = jira_client.search_issues('project = "TEST"', max_results=150)
+
+        assert [issue["key"] for issue in issues] == [f"TEST-{i}" for i in range(150)]
+        requested = sorted(
+            (int(_query(call)["startAt"][0]), int(_query(call)["maxResults"][0]))
+            for call in responses.calls
         )
+        assert requested == [(0, 100), (100, 50)]
+
+    @responses.activate
+    def test_search_issues_short_first_page_does_not_overlap(
+        self, jira_client, register_paged_search
+    ):
+        """Test that later pages use the first page's size when Jira caps it."""
+        # The server trims only the first page to 50 issues
+        register_paged_search(200, first_page_cap=50)
+
+        issues = jira_client.search_issues('project = "TEST"')
+
+        assert [issue["key"] for issue in issues] == [f"TEST-{i}" for i in range(200)]
+        later_sizes = {_query(call)["maxResults"][0] for call in responses.calls[1:]}
+        assert later_sizes == {"50"}
 
-        responses.add(
-            responses.GET,
-            "https://test.atlassian.net/rest/api/3/search/jql",
-            json={"errorMessages": ["Unauthorized"]},
-            status=401,
+    @responses.activate
+    def test_search_issues_next_page_token(self, jira_client, register_search):
+        """Test sequential pagination when the response has no total."""
+        register_search(
+            {
+                "isLast": False,
+                "nextPageToken": "page-2",
+                "issues": [{"key": "TEST-1", "fields": {"summary": "Issue 1"}}],
+            },
+        )
+        register_search(
+            {
+                "isLast": True,
+                "issues": [{"key": "TEST-2", "fields": {"summary": "Issue 2"}}],
+            },
         )
 
-        with pytest.raises(JiraAPIError, match="401"):
-            client.search_issues('project = "TEST"')
+        issues = jira_client.search_issues('project = "TEST"')
+
+        assert [issue["key"] for issue in issues] == ["TEST-1", "TEST-2"]
+        second_query = _query(responses.calls[1])
+        assert second_query["nextPageToken"] == ["page-2"]
 
     @responses.activate
-    def test_search_issues_http_error_404(self):
-        """Test handling of 404 Not Found error."""
-        client = JiraClient(
-            base_url="https://test.atlassian.net",
-            username="user@example.com",
-            api_token="token",
+    def test_iter_issues_is_lazy(self, jira_client, register_search):
+        """Test that iter_issues only requests pages as they are consumed."""
+        register_search(
+            {
+                "total": 1,
+                "issues": [{"key": "TEST-1", "fields": {"summary": "Issue 1"}}],
+            },
         )
 
-        responses.add(
-            responses.GET,
-            "https://test.atlassian.net/rest/api/3/search/jql",
-            json={"errorMessages": ["Not found"]},
-            status=404,
+        issues = jira_client.iter_issues('project = "TEST"')
+        assert len(responses.calls) == 0
+
+        assert next(issues)["key"] == "TEST-1"
+        assert list(issues) == []
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_iter_issues_fetches_bounded_window_ahead(
+        self, jira_client, register_paged_search
+    ):
+        """Test that a multi-page search only prefetches PAGE_WORKERS pages."""
+        register_paged_search(5000)
+
+        issues = jira_client.iter_issues('project = "TEST"', max_results=5000)
+        consumed = list(islice(issues, JiraClient.PAGE_SIZE + 1))
+
+        assert len(consumed) == JiraClient.PAGE_SIZE + 1
+        # Give any eagerly submitted page requests time to run; a bounded
+        # window never submits more, however long we wait
+        time.sleep(0.2)
+        # First page, the initial window, and one refill after page two
+        assert len(responses.calls) <= 1 + JiraClient.PAGE_WORKERS + 1
+
+        assert len(consumed) + len(list(issues)) == 5000
+
+    @responses.activate
+    def test_search_issues_retries_rate_limit(self, jira_client, register_search):
+        """Test that 429 responses are retried honoring Retry-After."""
+        register_search(
+            {"errorMessages": ["Rate limit exceeded"]},
+            status=429,
+            headers={"Retry-After": "2"},
         )
+        register_search({"total": 1, "issues": [{"key": "TEST-1", "fields": {}}]})
 
-        with pytest.raises(JiraAPIError, match="404"):
-            client.search_issues('project = "TEST"')
+        with patch("jira_client.time.sleep") as mock_sleep:
+            issues = jira_client.search_issues('project = "TEST"')
+
+        assert [issue["key"] for issue in issues] == ["TEST-1"]
+        mock_sleep.assert_called_once()
+        delay = mock_sleep.call_args[0][0]
+        assert 2 <= delay <= 2 + JiraClient.RETRY_BACKOFF_FACTOR
 
     @responses.activate
-    def test_search_issues_empty_result(self):
-        """Test handling of empty search results."""
-        client = JiraClient(
-            base_url="https://test.atlassian.net",
-            username="user@example.com",
-            api_token="token",
+    def test_search_issues_rate_limit_exhausted(self, jira_client, register_search):
+        """Test that persistent 429 responses raise JiraAPIError."""
+        register_search({"errorMessages": ["Rate limit exceeded"]}, status=429)
+
+        with patch("jira_client.time.sleep") as mock_sleep:
+            with pytest.raises(JiraAPIError, match="429"):
+                jira_client.search_issues('project = "TEST"')
+
+        assert mock_sleep.call_count == JiraClient.MAX_RETRIES
+
+    @responses.activate
+    def test_search_issues_rate_limit_retry_after_too_long(
+        self, jira_client, register_search
+    ):
+        """Test that a Retry-After above the limit fails instead of sleeping."""
+        register_search(
+            {"errorMessages": ["Rate limit exceeded"]},
+            status=429,
+            headers={"Retry-After": "86400"},
         )
 
-        responses.add(
-            responses.GET,
-            "https://test.atlassian.net/rest/api/3/search/jql",
-            json={"total": 0, "issues": []},
-            status=200,
+        with patch("jira_client.time.sleep") as mock_sleep:
+            with pytest.raises(JiraAPIError, match="Retry-After"):
+                jira_client.search_issues('project = "TEST"')
+
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.parametrize("retry_after", ["inf", "nan"])
+    @responses.activate
+    def test_search_issues_rate_limit_non_finite_retry_after(
+        self, jira_client, register_search, retry_after
+    ):
+        """Test that a non-finite Retry-After falls back to the backoff."""
+        register_search(
+            {"errorMessages": ["Rate limit exceeded"]},
+            status=429,
+            headers={"Retry-After": retry_after},
         )
+        register_search({"total": 1, "issues": [{"key": "TEST-1", "fields": {}}]})
 
-        issues = client.search_issues('project = "NONEXISTENT"')
+        with patch("jira_client.time.sleep") as mock_sleep:
+            issues = jira_client.search_issues('project = "TEST"')
 
-        assert len(issues) == 0
+        assert [issue["key"] for issue in issues] == ["TEST-1"]
+        delay = mock_sleep.call_args[0][0]
+        assert 0 < delay <= 2 * JiraClient.RETRY_BACKOFF_FACTOR
 
     @responses.activate
-    def test_search_issues_status_normalization(self):
-        """Test that status categories are normalized."""
+    def test_search_issues_http_error_401(self, register_search):
+        """Test handling of 401 Unauthorized error."""
         client = JiraClient(
             base_url="https://test.atlassian.net",
             username="user@example.com",
-            api_token="token",
+            api_token="bad_token",
         )
 
-        responses.add(
-            responses.GET,
-            "https://test.atlassian.net/rest/api/3/search/jql",
-            json={
+        register_search({"errorMessages": ["Unauthorized"]}, status=401)
+
+        with pytest.raises(JiraAPIError, match="401"):
+            client.search_issues('project = "TEST"')
+
+    @responses.activate
+    def test_search_issues_http_error_404(self, jira_client, register_search):
+        """Test handling of 404 Not Found error."""
+        register_search({"errorMessages": ["Not found"]}, status=404)
+
+        with pytest.raises(JiraAPIError, match="404"):
+            jira_client.search_issues('project = "TEST"')
+
+    @responses.activate
+    def test_search_issues_empty_result(self, jira_client, register_search):
+        """Test handling of empty search results."""
+        register_search({"total": 0, "issues": []})
+
+        issues = jira_client.search_issues('project = "NONEXISTENT"')
+
+        assert len(issues) == 0
+
+    @responses.activate
+    def test_search_issues_status_normalization(self, jira_client, register_search):
+        """Test that status categories are normalized."""
+        register_search(
+            {
                 "total": 3,
                 "issues": [
                     {
@@ -290,28 +450,19 @@ class TestJiraClientSearchIssues:
                     },
                 ],
             },
-            status=200,
         )
 
-        issues = client.search_issues('project = "TEST"')
+        issues = jira_client.search_issues('project = "TEST"')
 
         assert issues[0]["status"] == "Done"
         assert issues[1]["status"] == "In Progress"
         assert issues[2]["status"] == "To Do"
 
     @responses.activate
-    def test_search_issues_missing_fields(self):
+    def test_search_issues_missing_fields(self, jira_client, register_search):
         """Test handling of issues with missing fields."""
-        client = JiraClient(
-            base_url="https://test.atlassian.net",
-            username="user@example.com",
-            api_token="token",
-        )
-
-        responses.add(
-            responses.GET,
-            "https://test.atlassian.net/rest/api/3/search/jql",
-            json={
+        register_search(
+            {
                 "total": 1,
                 "issues": [
                     {
@@ -325,34 +476,100 @@ class TestJiraClientSearchIssues:
                     },
                 ],
             },
-            status=200,
         )
 
-        issues = client.search_issues('project = "TEST"')
+        issues = jira_client.search_issues('project = "TEST"')
 
         assert len(issues) == 1
         assert issues[0]["key"] == "TEST-1"
         assert issues[0]["summary"] == ""
         assert issues[0]["status"] == "To Do"
 
+    @responses.activate
+    def test_search_issues_requests_only_needed_fields(self, jira_client, register_search):
+        """Test that searches ask Jira for the normalized fields only."""
+        register_search({"total": 0, "issues": []})
+
+        jira_client.search_issues('project = "TEST"')
+
+        query = _query(responses.calls[0])
+        assert query["fields"] == [",".join(JiraClient.FIELDS)]
+        assert "key" not in JiraClient.FIELDS
+
+    @responses.activate
+    def test_search_issues_null_nested_fields(self, jira_client, register_search):
+        """Test that null nested objects fall back to defaults."""
+        register_search(
+            {
+                "total": 2,
+                "issues": [
+                    {"key": "TEST-1", "fields": None},
+                    {
+                        "key": "TEST-2",
+                        "fields": {
+                            "status": {"statusCategory": None},
+                            "assignee": {"accountId": "abc123"},
+                        },
+                    },
+                ],
+            },
+        )
+
+        issues = jira_client.search_issues('project = "TEST"')
+
+        assert [issue["status"] for issue in issues] == ["To Do", "To Do"]
+        assert [issue["assignee"] for issue in issues] == ["Unassigned", "Unassigned"]
+        assert issues[0]["summary"] == ""
+
+    @responses.activate
+    def test_search_issues_milestone_extraction(self, jira_client, register_search):
+        """Test milestone names from fix version with affects version fallback."""
+        register_search(
+            {
+                "total": 4,
+                "issues": [
+                    {
+                        "key": "TEST-1",
+                        "fields": {"customfield_10037": [{"name": "5.24.0"}]},
+                    },
+                    {
+                        "key": "TEST-2",
+                        "fields": {"customfield_10037": {"name": "5.25.0"}},
+                    },
+                    {
+                        "key": "TEST-3",
+                        "fields": {
+                            "customfield_10037": None,
+                            "customfield_10041": ["5.25.3"],
+                        },
+                    },
+                    {
+                        "key": "TEST-4",
+                        "fields": {"customfield_10037": [], "customfield_10041": None},
+                    },
+                ],
+            },
+        )
+
+        issues = jira_client.search_issues('project = "TEST"')
+
+        assert [issue["milestone"] for issue in issues] == [
+            "5.24.0",
+            "5.25.0",
+            "5.25.3",
+            "",
+        ]
+
 
 class TestJiraClientProjectVersions:
     """Test suite for get_project_versions method."""
 
     @responses.activate
-    def test_get_project_versions_success(self):
+    def test_get_project_versions_success(self, jira_client, register_search):
         """Test successful retrieval of project milestones from Epic issues."""
-        client = JiraClient(
-            base_url="https://test.atlassian.net",
-            username="user@example.com",
-            api_token="token",
-        )
-
         # Mock search API response with Epic milestone issues
-        responses.add(
-            responses.GET,
-            "https://test.atlassian.net/rest/api/3/search/jql",
-            json={
+        register_search(
+            {
                 "total": 2,
                 "issues": [
                     {
@@ -371,10 +588,9 @@ class TestJiraClientProjectVersions:
                     },
                 ],
             },
-            status=200,
         )
 
-        versions = client.get_project_versions("TEST")
+        versions = jira_client.get_project_versions("TEST")
 
         assert len(versions) == 2
         assert versions[0]["id"] == "TEST-1"
@@ -384,18 +600,10 @@ class TestJiraClientProjectVersions:
         assert versions[1]["name"] == "Milestone 2"
 
     @responses.activate
-    def test_get_project_versions_multiple_epics(self):
+    def test_get_project_versions_multiple_epics(self, jira_client, register_search):
         """Test retrieval of multiple Epic milestones."""
-        client = JiraClient(
-            base_url="https://test.atlassian.net",
-            username="user@example.com",
-            api_token="token",
-        )
-
-        responses.add(
-            responses.GET,
-            "https://test.atlassian.net/rest/api/3/search/jql",
-            json={
+        register_search(
+            {
                 "total": 3,
                 "issues": [
                     {
@@ -421,10 +629,9 @@ class TestJiraClientProjectVersions:
                     },
                 ],
             },
-            status=200,
         )
 
-        versions = client.get_project_versions("TEST")
+        versions = jira_client.get_project_versions("TEST")
 
         assert len(versions) == 3
         assert versions[0]["name"] == "v1.0"
@@ -432,40 +639,118 @@ class TestJiraClientProjectVersions:
         assert versions[2]["name"] == "v3.0"
 
     @responses.activate
-    def test_get_project_versions_empty(self):
-        """Test retrieval when no Epic milestones exist."""
-        client = JiraClient(
-            base_url="https://test.atlassian.net",
-            username="user@example.com",
-            api_token="token",
+    def test_get_project_versions_adf_description(self, jira_client, register_search):
+        """Test that text is extracted from ADF (rich text) descriptions."""
+        register_search(
+            {
+                "total": 1,
+                "issues": [
+                    {
+                        "key": "TEST-1",
+                        "fields": {
+                            "summary": "Milestone 1",
+                            "description": {
+                                "type": "doc",
+                                "content": [
+                                    {
+                                        "type": "paragraph",
+                                        "content": [
+                                            {"type": "text", "text": "First "},
+                                            {"type": "hardBreak"},
+                                            {"type": "text", "text": "line"},
+                                        ],
+                                    },
+                                    {"type": "rule"},
+                                    {
+                                        "type": "paragraph",
+                                        "content": [{"type": "text", "text": "."}],
+                                    },
+                                ],
+                            },
+                        },
+                    },
+                ],
+            },
         )
 
-        responses.add(
-            responses.GET,
-            "https://test.atlassian.net/rest/api/3/search/jql",
-            json={"total": 0, "issues": []},
-            status=200,
-        )
+        versions = jira_client.get_project_versions("TEST")
 
-        versions = client.get_project_versions("TEST")
+        assert versions[0]["description"] == "First line."
 
-        assert len(versions) == 0
+    @responses.activate
+    def test_get_project_versions_pagination(self, jira_client, register_paged_search):
+        """Test that milestones spanning several result pages are all returned."""
+        register_paged_search(5, page_cap=2)
+
+        versions = jira_client.get_project_versions("TEST")
+
+        assert [v["id"] for v in versions] == [f"TEST-{i}" for i in range(5)]
 
     @responses.activate
-    def test_get_project_versions_api_error(self):
-        """Test handling of API errors."""
-        client = JiraClient(
-            base_url="https://test.atlassian.net",
-            username="user@example.com",
-            api_token="token",
+    def test_get_project_versions_cached(self, jira_client, register_search):
+        """Test that repeated calls for a project reuse the first result."""
+        register_search(
+            {
+                "total": 1,
+                "issues": [{"key": "TEST-1", "fields": {"summary": "Milestone 1"}}],
+            },
         )
 
-        responses.add(
-            responses.GET,
-            "https://test.atlassian.net/rest/api/3/search/jql",
-            json={"errorMessages": ["Project not found"]},
-            status=401,
+        first = jira_client.get_project_versions("TEST")
+        second = jira_client.get_project_versions("TEST")
+
+        assert second == first
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_get_project_versions_cache_expires(self, jira_client, register_search):
+        """Test that cached milestones are refetched after the TTL."""
+        register_search(
+            {
+                "total": 1,
+                "issues": [{"key": "TEST-1", "fields": {"summary": "Milestone 1"}}],
+            },
         )
 
+        with patch("jira_client.time.monotonic", return_value=1000.0):
+            jira_client.get_project_versions("TEST")
+        with patch(
+            "jira_client.time.monotonic",
+            return_value=1000.0 + JiraClient.VERSIONS_CACHE_TTL,
+        ):
+            jira_client.get_project_versions("TEST")
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_invalidate_versions(self, jira_client, register_search):
+        """Test that invalidation forces the next call to refetch."""
+        register_search({"total": 0, "issues": []})
+
+        jira_client.get_project_versions("TEST")
+        jira_client.get_project_versions("OTHER")
+        jira_client.invalidate_versions("TEST")
+        jira_client.get_project_versions("TEST")
+        jira_client.get_project_versions("OTHER")
+        assert len(responses.calls) == 3
+
+        jira_client.invalidate_versions()
+        jira_client.get_project_versions("OTHER")
+        assert len(responses.calls) == 4
+
+    @responses.activate
+    def test_get_project_versions_empty(self, jira_client, register_search):
+        """Test retrieval when no Epic milestones exist."""
+        register_search({"total": 0, "issues": []})
+
+        versions = jira_client.get_project_versions("TEST")
+
+        assert len(versions) == 0
+
+    @responses.activate
+    def test_get_project_versions_api_error(self, jira_client, register_search):
+        """Test handling of API errors."""
+        register_search({"errorMessages": ["Project not found"]}, status=401)
+
         with pytest.raises(JiraAPIError):
-            client.get_project_versions("TEST")
+            jira_client.get_project_versions("TEST")
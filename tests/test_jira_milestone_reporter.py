@@ -0,0 +1,172 @@
+"""
+Unit tests for jira_milestone_reporter.py module.
+"""
+
+import re
+import threading
+
+import pytest
+
+import jira_milestone_reporter as reporter
+
+
+class FakeJiraClient:
+    """Stand-in for JiraClient returning canned milestones and issues."""
+
+    def __init__(self, milestones=None, issues=None, wait_for=None):
+        # issues: Epic key -> list of issues, or an exception to raise
+        # wait_for: Epic key -> Epic key whose search must finish first
+        self.milestones = milestones or []
+        self.issues = issues or {}
+        self.wait_for = wait_for or {}
+        self.jqls = []
+        self.finished = []
+        self._done = {key: threading.Event() for key in self.issues}
+        self._lock = threading.Lock()
+        self.entered = False
+        self.exited = False
+
+    def __call__(self, base_url, username, api_token):
+        # Used in place of the JiraClient class: "constructing" returns self
+        return self
+
+    def __enter__(self):
+        self.entered = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.exited = True
+
+    def get_project_versions(self, project_key):
+        return self.milestones
+
+    def search_issues(self, jql):
+        epic_key = re.search(r'"Epic Link" = (\S+)', jql).group(1)
+        with self._lock:
+            self.jqls.append(jql)
+        blocker = self.wait_for.get(epic_key)
+        if blocker is not None:
+            assert self._done[blocker].wait(timeout=5)
+        try:
+            result = self.issues[epic_key]
+            if isinstance(result, Exception):
+                raise result
+            return result
+        finally:
+            with self._lock:
+                self.finished.append(epic_key)
+            self._done[epic_key].set()
+
+
+def _milestone(key):
+    """Build an open Epic milestone."""
+    return {"id": key, "key": key, "name": f"Milestone {key}", "description": ""}
+
+
+def _issues(*keys):
+    """Build normalized issues with the given keys."""
+    return [
+        {"key": key, "summary": f"Issue {key}", "status": "To Do"} for key in keys
+    ]
+
+
+def _index_links(output_dir):
+    """Milestone report links on the index page, in page order."""
+    index = (output_dir / "index.html").read_text()
+    return re.findall(r'class="milestone-title-link" href="([^"]+)"', index)
+
+
+@pytest.fixture
+def reporter_env(monkeypatch, tmp_path):
+    """Configure the reporter through the environment, writing to tmp_path."""
+    env_vars = {
+        "JIRA_BASE_URL": "https://test.atlassian.net",
+        "JIRA_USERNAME": "user@example.com",
+        "JIRA_API_TOKEN": "token",
+        "JIRA_PROJECT_KEY": "TEST",
+        "TIMELINE_TITLE": "Test Timeline",
+        "OUTPUT_DIR": str(tmp_path / "output"),
+    }
+    for key, value in env_vars.items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.delenv("START_DATE_FIELD", raising=False)
+    monkeypatch.delenv("INCREMENTAL_FETCH", raising=False)
+    return tmp_path / "output"
+
+
+class TestMain:
+    """Test suite for the main() entry point."""
+
+    def test_main_closes_client_via_context_manager(self, reporter_env, monkeypatch):
+        """Test that main() uses the client as a context manager."""
+        fake = FakeJiraClient()
+        monkeypatch.setattr(reporter, "JiraClient", fake)
+
+        assert reporter.main() == 0
+        assert fake.entered and fake.exited
+
+    def test_main_keeps_index_order_with_out_of_order_fetches(
+        self, reporter_env, monkeypatch
+    ):
+        """Test index order and error isolation across concurrent fetches."""
+        fake = FakeJiraClient(
+            milestones=[_milestone(k) for k in ("WT-1", "WT-2", "WT-3", "WT-4")],
+            issues={
+                "WT-1": _issues("WT-10"),
+                "WT-2": reporter.JiraClientError("search failed"),
+                "WT-3": _issues("WT-30", "WT-31"),
+                "WT-4": _issues("WT-40"),
+            },
+            # Finish in reverse order: WT-4, WT-3, WT-2, then WT-1
+            wait_for={"WT-1": "WT-2", "WT-2": "WT-3", "WT-3": "WT-4"},
+        )
+        monkeypatch.setattr(reporter, "JiraClient", fake)
+
+        assert reporter.main() == 0
+
+        assert fake.finished == ["WT-4", "WT-3", "WT-2", "WT-1"]
+        assert _index_links(reporter_env) == [
+            "milestone-WT-1.html",
+            "milestone-WT-3.html",
+            "milestone-WT-4.html",
+        ]
+        assert not (reporter_env / "milestone-WT-2.html").exists()
+
+    def test_main_incremental_fetch_across_runs(self, reporter_env, monkeypatch):
+        """Test that a warm run narrows searches except for failed milestones."""
+        monkeypatch.setenv("INCREMENTAL_FETCH", "true")
+        milestones = [_milestone("WT-1"), _milestone("WT-2")]
+
+        first = FakeJiraClient(
+            milestones=milestones,
+            issues={
+                "WT-1": _issues("WT-10", "WT-11"),
+                "WT-2": reporter.JiraClientError("search failed"),
+            },
+        )
+        monkeypatch.setattr(reporter, "JiraClient", first)
+        assert reporter.main() == 0
+        assert all("updated >=" not in jql for jql in first.jqls)
+
+        second = FakeJiraClient(
+            milestones=milestones,
+            issues={"WT-1": _issues("WT-11"), "WT-2": _issues("WT-20")},
+        )
+        monkeypatch.setattr(reporter, "JiraClient", second)
+        assert reporter.main() == 0
+
+        jqls = {
+            re.search(r'"Epic Link" = (\S+)', jql).group(1): jql
+            for jql in second.jqls
+        }
+        assert re.search(r" AND updated >= -\d+m$", jqls["WT-1"])
+        # WT-2 was never cached, so it is fetched in full
+        assert "updated >=" not in jqls["WT-2"]
+
+        # Cached issues are merged with the ones updated since the first run
+        report = (reporter_env / "milestone-WT-1.html").read_text()
+        assert "WT-10" in report and "WT-11" in report
+        assert _index_links(reporter_env) == [
+            "milestone-WT-1.html",
+            "milestone-WT-2.html",
+        ]